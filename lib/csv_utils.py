@@ -9,11 +9,17 @@ import shutil
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from .columns import CORRECT_COLUMNS, REQUIRED_COLUMNS
 
 
+# Matches any value sanitize_csv_field() would change: whitespace other than
+# a plain space, doubled/leading/trailing spaces, HTML entities, or commas.
+# Most stored fields are already clean, so this lets them skip the rewrite.
+_NEEDS_SANITIZE_RE = re.compile(r"[^\S ]|  |^ | $|[,&]")
+
+
 class CSVColumnError(Exception):
     """Raised when a CSV is missing required columns."""
     pass
@@ -32,6 +38,8 @@ def sanitize_csv_field(value) -> str:
     if value is None:
         return ""
     val = str(value)
+    if not _NEEDS_SANITIZE_RE.search(val):
+        return val
     # Strip newlines, collapse whitespace
     val = val.replace("\r\n", " ").replace("\r", " ").replace("\n", " ")
     val = re.sub(r"\s+", " ", val).strip()
@@ -48,25 +56,27 @@ def sanitize_csv_field(value) -> str:
     return val
 
 
-def load_csv(csv_path: Path, validate: bool = True) -> List[Dict]:
+def _check_required_columns(csv_path: Path, fieldnames: List[str]) -> None:
+    """Raise CSVColumnError if fieldnames lacks any REQUIRED_COLUMNS."""
+    missing = REQUIRED_COLUMNS - set(fieldnames)
+    if missing:
+        raise CSVColumnError(
+            f"CSV {csv_path} missing required columns: "
+            f"{', '.join(sorted(missing))}"
+        )
+
+
+def iter_csv(csv_path: Path, validate: bool = True) -> Iterator[Dict]:
     """
-    Load a CSV file and return list of dicts.
+    Lazily yield a CSV file's rows as dicts, one at a time.
 
-    Args:
-        csv_path: Path to the CSV file.
-        validate: If True (default), check that REQUIRED_COLUMNS are present.
-                  Raises CSVColumnError if any are missing.
+    Same validation and header handling as load_csv(), without holding
+    the whole file in memory.
     """
-    rows = []
     with open(csv_path, "r", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         if validate and reader.fieldnames:
-            missing = REQUIRED_COLUMNS - set(reader.fieldnames)
-            if missing:
-                raise CSVColumnError(
-                    f"CSV {csv_path} missing required columns: "
-                    f"{', '.join(sorted(missing))}"
-                )
+            _check_required_columns(csv_path, reader.fieldnames)
         # Backward compat: detect old "Chain" header → rename to "Ecosystem/Chain"
         needs_chain_rename = (
             reader.fieldnames
@@ -76,23 +86,50 @@ def load_csv(csv_path: Path, validate: bool = True) -> List[Dict]:
         for row in reader:
             if needs_chain_rename and "Chain" in row:
                 row["Ecosystem/Chain"] = row.pop("Chain")
-            rows.append(row)
-    return rows
+            yield row
+
+
+def load_csv(csv_path: Path, validate: bool = True) -> List[Dict]:
+    """
+    Load a CSV file and return list of dicts.
+
+    Args:
+        csv_path: Path to the CSV file.
+        validate: If True (default), check that REQUIRED_COLUMNS are present.
+                  Raises CSVColumnError if any are missing.
+    """
+    return list(iter_csv(csv_path, validate=validate))
 
 
 def get_names_from_csv(csv_path: Path) -> List[str]:
-    """Load just the Project Name column from a CSV."""
-    return [row["Project Name"] for row in load_csv(csv_path)]
+    """
+    Load just the Project Name column from a CSV.
+
+    Reads rows positionally (csv.reader) instead of building a dict per
+    row; validation and blank-line handling match load_csv().
+    """
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return []
+        _check_required_columns(csv_path, header)
+        # DictReader keeps the last of any duplicated header
+        idx = len(header) - 1 - header[::-1].index("Project Name")
+        return [row[idx] if idx < len(row) else None for row in reader if row]
 
 
 def write_csv(
-    rows: List[Dict],
+    rows: Iterable[Dict],
     output_path: Path,
     columns: Optional[List[str]] = None,
 ):
     """
     Write rows to CSV with correct column order.
 
+    rows may be any iterable, including a lazy one reading from output_path
+    itself (e.g. iter_csv): the original stays in place until the final swap.
+
     Uses atomic write: writes to a temp file in the same directory, then
     os.replace() for an atomic swap. This prevents data loss if the process
     is interrupted mid-write (the original file stays intact or is fully
@@ -110,11 +147,12 @@ def write_csv(
     )
     try:
         with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=cols)
-            writer.writeheader()
+            # Positional writer: rows are projected onto cols directly,
+            # skipping DictWriter's per-row dict rebuild and key validation
+            writer = csv.writer(f)
+            writer.writerow(cols)
             for row in rows:
-                clean_row = {k: sanitize_csv_field(row.get(k, "")) for k in cols}
-                writer.writerow(clean_row)
+                writer.writerow([sanitize_csv_field(row.get(k, "")) for k in cols])
             f.flush()
             os.fsync(f.fileno())
         # Atomic replace — POSIX guarantees this is atomic on same filesystem
@@ -136,10 +174,9 @@ def append_csv(
     """Append rows to an existing CSV."""
     cols = columns or CORRECT_COLUMNS
     with open(csv_path, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=cols)
+        writer = csv.writer(f)
         for row in rows:
-            clean_row = {k: sanitize_csv_field(row.get(k, "")) for k in cols}
-            writer.writerow(clean_row)
+            writer.writerow([sanitize_csv_field(row.get(k, "")) for k in cols])
 
 
 def resolve_data_path(chain: str, filename: Optional[str] = None) -> Path:
@@ -161,11 +198,9 @@ def find_main_csv(chain: str) -> Optional[Path]:
     Looks for *_ecosystem_research.csv in data/<chain>/.
     Returns the path if found, None otherwise.
     """
-    data_dir = resolve_data_path(chain)
-    if not data_dir.exists():
-        return None
-    csvs = list(data_dir.glob("*_ecosystem_research.csv"))
-    return csvs[0] if csvs else None
+    # glob() of a missing directory yields nothing, so no separate exists()
+    # check; stop at the first match instead of listing them all
+    return next(resolve_data_path(chain).glob("*_ecosystem_research.csv"), None)
 
 
 def backup_csv(csv_path: Path, suffix: str = None) -> Path:
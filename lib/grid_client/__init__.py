@@ -14,7 +14,12 @@ Usage:
 from .client import GridAPIClient
 from .matcher import GridEntityMatcher
 from .models import GridMatch, GridMultiMatch
-from .support import TARGET_ASSET_GRID_MAP, extract_supported_tickers, check_target_support
+from .support import (
+    TARGET_ASSET_GRID_MAP,
+    extract_supported_tickers,
+    check_target_support,
+    target_support_mask,
+)
 
 __all__ = [
     "GridAPIClient",
@@ -24,4 +29,5 @@ __all__ = [
     "TARGET_ASSET_GRID_MAP",
     "extract_supported_tickers",
     "check_target_support",
+    "target_support_mask",
 ]
@@ -4,11 +4,13 @@ CLI entry point for The Grid API client.
 
 Usage:
     python -m lib.grid_client search "Aptos"
+    python -m lib.grid_client search "Aptos" "Sui" "Starknet"
     python -m lib.grid_client search_profiles "Aptos" --limit 5
     python -m lib.grid_client search_products "Aptos" --limit 10
     python -m lib.grid_client search_assets "APT" --limit 5
     python -m lib.grid_client match-url "https://thalalabs.xyz"
     python -m lib.grid_client types
+    python -m lib.grid_client types --no-cache
     python -m lib.grid_client raw "{ products(limit: 3) { name } }"
 """
 
@@ -16,7 +18,11 @@ import argparse
 import json
 import sys
 
-from .client import GridAPIClient
+from .client import DEFAULT_CACHE_DIR, GridAPIClient
+
+
+# Fields naming an item's type, by result kind (first non-empty wins)
+_TYPE_KEYS = ("productType", "profileType", "assetType", "entityType")
 
 
 def format_results(data, format_type="simple"):
@@ -31,24 +37,22 @@ def format_results(data, format_type="simple"):
             if isinstance(items, list):
                 output.append(f"\n=== {key.upper()} ({len(items)} results) ===\n")
                 for item in items:
-                    name = item.get("name", item.get("ticker", "Unknown"))
-                    item_id = item.get("id", "")
-                    desc = item.get("description", item.get("descriptionShort", ""))
+                    get = item.get
+                    name = get("name") if "name" in item else get("ticker", "Unknown")
+                    desc = get("description") if "description" in item else get("descriptionShort", "")
                     if desc and len(desc) > 100:
                         desc = desc[:100] + "..."
 
-                    item_type = (
-                        item.get("productType", {}).get("name", "")
-                        or item.get("profileType", {}).get("name", "")
-                        or item.get("assetType", {}).get("name", "")
-                        or item.get("entityType", {}).get("name", "")
-                    )
+                    item_type = ""
+                    for type_key in _TYPE_KEYS:
+                        item_type = get(type_key, {}).get("name", "")
+                        if item_type:
+                            break
                     if isinstance(item_type, dict):
                         item_type = item_type.get("name", "")
 
-                    ticker = item.get("ticker", "")
-                    root = item.get("root", {}) or {}
-                    url = root.get("urlMain", "")
+                    ticker = get("ticker", "")
+                    url = (get("root", {}) or {}).get("urlMain", "")
 
                     line = f"  - {name}"
                     if ticker:
@@ -61,6 +65,7 @@ def format_results(data, format_type="simple"):
                         output.append(f"    URL: {url}")
                     if desc:
                         output.append(f"    {desc}")
+                    item_id = get("id", "")
                     if item_id:
                         output.append(f"    ID: {item_id}")
                     output.append("")
@@ -96,6 +101,9 @@ def main():
         help="Command to run",
     )
     parser.add_argument("query", nargs="?", help="Search query or raw GraphQL")
+    parser.add_argument(
+        "more", nargs="*", help="Further search terms (search only, queried concurrently)"
+    )
     parser.add_argument(
         "--limit", "-l", type=int, default=10, help="Max results (default: 10)"
     )
@@ -106,14 +114,32 @@ def main():
         default="simple",
         help="Output format",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always fetch type lists from the API (default: cached 24h in {DEFAULT_CACHE_DIR})",
+    )
 
     args = parser.parse_args()
-    client = GridAPIClient()
+    if args.more and args.command != "search":
+        parser.error(f"unrecognized arguments: {' '.join(args.more)}")
+    client = GridAPIClient(cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
 
     if args.command == "search":
         if not args.query:
             print("Error: search requires a query term")
             sys.exit(1)
+        if args.more:
+            terms = [args.query] + args.more
+            print(f"\nSearching all types for: {', '.join(terms)}\n")
+            results = client.search_all_many(terms, limit=args.limit)
+            if args.format == "json":
+                print(format_results(results, "json"))
+            else:
+                for term, result in results.items():
+                    print(f"\n##### {term} #####")
+                    print(format_results(result, args.format))
+            return
         print(f"\nSearching all types for: {args.query}\n")
         result = client.search_all(args.query, limit=args.limit)
 
@@ -5,18 +5,27 @@ Endpoint: https://beta.node.thegrid.id/graphql
 No authentication required for public queries.
 """
 
+import gzip
+import http.client
 import json
+import os
+import tempfile
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Optional
-from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, urlopen
 
 from .queries import (
     SEARCH_PROFILES_QUERY,
     SEARCH_PRODUCTS_QUERY,
     SEARCH_ASSETS_QUERY,
     SEARCH_ENTITIES_QUERY,
+    SEARCH_ALL_QUERY,
     GET_PROFILE_DETAILS_QUERY,
     SEARCH_BY_URL_QUERY,
     GET_PRODUCT_TYPES_QUERY,
@@ -32,13 +41,20 @@ logger = logging.getLogger(__name__)
 
 GRID_ENDPOINT = "https://beta.node.thegrid.id/graphql"
 
+# On-disk cache for rarely-changing lookups (product/asset type lists)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "grid_client"
+TYPES_CACHE_TTL = 24 * 3600  # seconds
+
 
 class GridAPIClient:
     """
     Read-only client for The Grid's GraphQL API.
 
-    Uses urllib (no external dependencies). Includes retry logic
-    with exponential backoff for transient failures.
+    Uses http.client (no external dependencies) over a keep-alive
+    connection per thread, so repeated queries skip the TCP + TLS
+    handshake. When a proxy is configured (HTTP(S)_PROXY) it goes through
+    urlopen instead, which honours it. Includes retry logic with
+    exponential backoff for transient failures.
     """
 
     def __init__(
@@ -46,40 +62,136 @@ class GridAPIClient:
         endpoint: str = GRID_ENDPOINT,
         timeout: int = 15,
         max_retries: int = 3,
+        cache_dir: Optional[Path] = None,
     ):
         self.endpoint = endpoint
         self.timeout = timeout
         self.max_retries = max_retries
+        # None disables the on-disk cache for type lists
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Connections are not thread-safe; callers share one client
+        # across worker threads, so each thread keeps its own
+        self._local = threading.local()
+        # http.client ignores the proxy environment variables; urlopen does not
+        self._use_urlopen = bool(getproxies())
+        # Monotonic time the most recent paced call was scheduled to start
+        self._last_request_at = 0.0
+        self._pace_lock = threading.Lock()
+
+    def wait_for_request_slot(self, delay: float) -> None:
+        """
+        Sleep until delay seconds after the last paced call (across threads).
+
+        Callers running queries on several threads call this before each
+        one, so calls still start at most one per delay overall.
+        """
+        with self._pace_lock:
+            now = time.monotonic()
+            start = max(now, self._last_request_at + delay)
+            self._last_request_at = start
+        if start > now:
+            time.sleep(start - now)
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            parts = urlsplit(self.endpoint)
+            if parts.scheme == "https":
+                conn = http.client.HTTPSConnection(parts.netloc, timeout=self.timeout)
+            else:
+                conn = http.client.HTTPConnection(parts.netloc, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
+
+    def _post(self, data: bytes) -> bytes:
+        """
+        POST data to the endpoint and return the (decompressed) response body.
+
+        Raises HTTPError for error statuses and URLError for connection
+        failures, like urlopen, so _execute_query's handling is unchanged.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+        }
+        if self._use_urlopen:
+            req = Request(self.endpoint, data=data, headers=headers)
+            with urlopen(req, timeout=self.timeout) as response:
+                body = response.read()
+                encoding = response.headers.get("Content-Encoding", "")
+            if encoding.lower() == "gzip":
+                body = gzip.decompress(body)
+            return body
+
+        parts = urlsplit(self.endpoint)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        try:
+            conn = self._connection()
+            reused = conn.sock is not None
+            try:
+                conn.request("POST", target, body=data, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                # The server closed an idle keep-alive connection; reconnect once
+                self._drop_connection()
+                if not reused:
+                    raise
+                conn = self._connection()
+                conn.request("POST", target, body=data, headers=headers)
+                response = conn.getresponse()
+            body = response.read()
+        except TimeoutError:
+            self._drop_connection()
+            raise
+        except (OSError, http.client.HTTPException) as e:
+            self._drop_connection()
+            raise URLError(e)
+
+        if response.status >= 400:
+            raise HTTPError(self.endpoint, response.status, response.reason, response.msg, None)
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return body
 
     def _execute_query(
         self, query: str, variables: Optional[Dict] = None
     ) -> Dict:
         """Execute a GraphQL query with retry logic."""
+        result = self._execute_request(query, variables)
+        if result is None:
+            return {}
+        if "errors" in result:
+            logger.warning("GraphQL errors: %s", result["errors"])
+            return {}
+        return result.get("data", {})
+
+    def _execute_request(
+        self, query: str, variables: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        POST a GraphQL query with retry logic and return the whole response
+        (data and/or errors). Returns None if the request itself failed.
+        """
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
 
-        data = json.dumps(payload).encode("utf-8")
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
 
         last_error = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                req = Request(
-                    self.endpoint,
-                    data=data,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json",
-                    },
-                )
-                with urlopen(req, timeout=self.timeout) as response:
-                    result = json.loads(response.read().decode("utf-8"))
-
-                if "errors" in result:
-                    logger.warning("GraphQL errors: %s", result["errors"])
-                    return {}
-
-                return result.get("data", {})
+                # json.loads takes the UTF-8 body as bytes directly
+                return json.loads(self._post(data))
 
             except HTTPError as e:
                 last_error = e
@@ -94,7 +206,7 @@ class GridAPIClient:
                     continue
                 else:
                     logger.error("HTTP %d: %s", e.code, e.reason)
-                    return {}
+                    return None
 
             except (URLError, TimeoutError) as e:
                 last_error = e
@@ -108,10 +220,10 @@ class GridAPIClient:
 
             except Exception as e:
                 logger.error("Unexpected error: %s", e)
-                return {}
+                return None
 
         logger.error("All %d attempts failed. Last error: %s", self.max_retries, last_error)
-        return {}
+        return None
 
     # ── Search Methods ────────────────────────────────────────────
 
@@ -144,7 +256,29 @@ class GridAPIClient:
         return data.get("entities", [])
 
     def search_all(self, term: str, limit: int = 10) -> Dict[str, List[Dict]]:
-        """Search across all Grid types at once."""
+        """
+        Search across all Grid types at once.
+
+        Sends one combined query. If the response has GraphQL errors (an
+        error in any one search fails the whole request), falls back to the
+        four separate searches so one bad type doesn't empty the others. A
+        failed request (network/HTTP) is not retried that way: it has
+        already been through the retries, so all four results are empty.
+        """
+        result = self._execute_request(
+            SEARCH_ALL_QUERY, {"search": term, "limit": limit}
+        )
+        if result is not None and "errors" not in result:
+            data = result.get("data") or {}
+            return {
+                "profiles": data.get("profileInfos", []),
+                "products": data.get("products", []),
+                "assets": data.get("assets", []),
+                "entities": data.get("entities", []),
+            }
+        if result is None:
+            return {"profiles": [], "products": [], "assets": [], "entities": []}
+        logger.warning("GraphQL errors: %s", result["errors"])
         return {
             "profiles": self.search_profiles(term, limit),
             "products": self.search_products(term, limit),
@@ -152,19 +286,37 @@ class GridAPIClient:
             "entities": self.search_entities(term, limit),
         }
 
+    def search_all_many(
+        self, terms: List[str], limit: int = 10, max_workers: int = 4,
+    ) -> Dict[str, Dict[str, List[Dict]]]:
+        """
+        search_all() for several terms, run concurrently so their round
+        trips overlap. Returns {term: search_all(term)} in input order.
+        """
+        workers = max(1, min(max_workers, len(terms)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda term: self.search_all(term, limit), terms)
+            return dict(zip(terms, results))
+
     # ── Lookup Methods ────────────────────────────────────────────
 
+    @staticmethod
+    def normalize_search_url(url: str) -> str:
+        """
+        The form the URL searches send: protocol, "www." and trailing "/"
+        stripped for broader matching.
+        """
+        clean_url = url.replace("https://", "").replace("http://", "").replace("www.", "")
+        return clean_url.rstrip("/")
+
     def search_by_url(self, url: str) -> List[Dict]:
         """
         Find Grid entries by URL.
         Useful for matching scraped projects to Grid by their website.
         """
-        # Strip protocol and www for broader matching
-        clean_url = url.replace("https://", "").replace("http://", "").replace("www.", "")
-        # Remove trailing slash
-        clean_url = clean_url.rstrip("/")
-
-        data = self._execute_query(SEARCH_BY_URL_QUERY, {"url": clean_url})
+        data = self._execute_query(
+            SEARCH_BY_URL_QUERY, {"url": self.normalize_search_url(url)}
+        )
         return data.get("roots", [])
 
     def get_profile_details(self, name: str) -> Dict:
@@ -190,10 +342,8 @@ class GridAPIClient:
         Search roots by URL, returning full product→asset support data.
         Returns list of roots with products.productAssetRelationships.
         """
-        clean_url = url.replace("https://", "").replace("http://", "").replace("www.", "")
-        clean_url = clean_url.rstrip("/")
         data = self._execute_query(
-            SEARCH_ROOTS_BY_URL_WITH_SUPPORT_QUERY, {"url": clean_url}
+            SEARCH_ROOTS_BY_URL_WITH_SUPPORT_QUERY, {"url": self.normalize_search_url(url)}
         )
         return data.get("roots", [])
 
@@ -220,14 +370,45 @@ class GridAPIClient:
 
     # ── Reference Data ────────────────────────────────────────────
 
+    def _cached_query(self, name: str, query: str) -> Dict:
+        """
+        _execute_query() for a variable-free query, served from
+        cache_dir/<name>.json while younger than TYPES_CACHE_TTL.
+        Failed (empty) results are never cached.
+        """
+        if self.cache_dir is None:
+            return self._execute_query(query)
+
+        path = self.cache_dir / f"{name}.json"
+        try:
+            if time.time() - path.stat().st_mtime < TYPES_CACHE_TTL:
+                with open(path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        data = self._execute_query(query)
+        if data:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    suffix=".tmp", prefix=f".{path.name}.", dir=self.cache_dir,
+                )
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning("Could not write cache %s: %s", path, e)
+        return data
+
     def get_product_types(self) -> List[Dict]:
         """List all product types in The Grid."""
-        data = self._execute_query(GET_PRODUCT_TYPES_QUERY)
+        data = self._cached_query("product_types", GET_PRODUCT_TYPES_QUERY)
         return data.get("productTypes", [])
 
     def get_asset_types(self) -> List[Dict]:
         """List all asset types in The Grid."""
-        data = self._execute_query(GET_ASSET_TYPES_QUERY)
+        data = self._cached_query("asset_types", GET_ASSET_TYPES_QUERY)
         return data.get("assetTypes", [])
 
     def get_schema(self) -> Dict:
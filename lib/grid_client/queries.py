@@ -4,9 +4,11 @@ Parameterized GraphQL query templates for The Grid API.
 All queries use $variables for safe parameterization (no string formatting).
 """
 
+# Each search's selection is shared with SEARCH_ALL_QUERY below, so the
+# single-type and combined searches always ask for the same thing
+
 # Search profiles by name
-SEARCH_PROFILES_QUERY = """
-query SearchProfiles($search: String!, $limit: Int) {
+_PROFILES_SEARCH = """\
   profileInfos(
     where: {
       _or: [
@@ -27,12 +29,14 @@ query SearchProfiles($search: String!, $limit: Int) {
       urlMain
     }
   }
-}
+"""
+SEARCH_PROFILES_QUERY = """
+query SearchProfiles($search: String!, $limit: Int) {
+""" + _PROFILES_SEARCH + """}
 """
 
 # Search products by name
-SEARCH_PRODUCTS_QUERY = """
-query SearchProducts($search: String!, $limit: Int) {
+_PRODUCTS_SEARCH = """\
   products(
     where: {
       _or: [
@@ -52,12 +56,14 @@ query SearchProducts($search: String!, $limit: Int) {
       urlMain
     }
   }
-}
+"""
+SEARCH_PRODUCTS_QUERY = """
+query SearchProducts($search: String!, $limit: Int) {
+""" + _PRODUCTS_SEARCH + """}
 """
 
 # Search assets by name or ticker
-SEARCH_ASSETS_QUERY = """
-query SearchAssets($search: String!, $limit: Int) {
+_ASSETS_SEARCH = """\
   assets(
     where: {
       _or: [
@@ -77,12 +83,14 @@ query SearchAssets($search: String!, $limit: Int) {
       urlMain
     }
   }
-}
+"""
+SEARCH_ASSETS_QUERY = """
+query SearchAssets($search: String!, $limit: Int) {
+""" + _ASSETS_SEARCH + """}
 """
 
 # Search entities (legal structures)
-SEARCH_ENTITIES_QUERY = """
-query SearchEntities($search: String!, $limit: Int) {
+_ENTITIES_SEARCH = """\
   entities(
     where: {
       _or: [
@@ -98,7 +106,18 @@ query SearchEntities($search: String!, $limit: Int) {
     entityType { name }
     country { name }
   }
-}
+"""
+SEARCH_ENTITIES_QUERY = """
+query SearchEntities($search: String!, $limit: Int) {
+""" + _ENTITIES_SEARCH + """}
+"""
+
+# The four searches above in one request (GridAPIClient.search_all)
+SEARCH_ALL_QUERY = """
+query SearchAll($search: String!, $limit: Int) {
+""" + (
+    _PROFILES_SEARCH + _PRODUCTS_SEARCH + _ASSETS_SEARCH + _ENTITIES_SEARCH
+) + """}
 """
 
 # Get detailed profile info by exact name
@@ -23,19 +23,15 @@ def extract_supported_tickers(root_data: dict) -> Set[str]:
     """
     Extract all asset tickers that are 'Supported by' any product under this root.
     """
-    tickers = set()
-    for product in root_data.get("products", []):
-        for rel in product.get("productAssetRelationships", []):
-            support_type = rel.get("assetSupportType") or {}
-            if support_type.get("slug") == "supported_by":
-                asset = rel.get("asset", {})
-                ticker = asset.get("ticker", "")
-                name = asset.get("name", "")
-                if ticker:
-                    tickers.add(ticker)
-                if name:
-                    tickers.add(name)
-    return tickers
+    return {
+        value
+        for product in root_data.get("products", [])
+        for rel in product.get("productAssetRelationships", [])
+        if (rel.get("assetSupportType") or {}).get("slug") == "supported_by"
+        for asset in (rel.get("asset", {}),)
+        for value in (asset.get("ticker", ""), asset.get("name", ""))
+        if value
+    }
 
 
 def check_target_support(
@@ -51,3 +47,17 @@ def check_target_support(
         found = bool(grid_aliases & supported_tickers)
         result[asset] = found
     return result
+
+
+def target_support_mask(
+    supported_tickers: Set[str], target_assets: List[str]
+) -> int:
+    """
+    Bitmask form of check_target_support for per-row hot loops.
+    Bit i is set when target_assets[i] is supported.
+    """
+    mask = 0
+    for i, asset in enumerate(target_assets):
+        if not TARGET_ASSET_GRID_MAP.get(asset, {asset}).isdisjoint(supported_tickers):
+            mask |= 1 << i
+    return mask
@@ -4,6 +4,7 @@ Name normalization and similarity matching for ecosystem project comparison.
 
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Optional, Tuple, List
 
 # Suffixes to strip during normalization (merged from all scripts)
@@ -24,6 +25,7 @@ STRIP_SUFFIXES = [
 ]
 
 
+@lru_cache(maxsize=65536)
 def normalize_name(name: str) -> str:
     """
     Normalize a project name for comparison.
@@ -45,8 +47,14 @@ def normalize_name(name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=65536)
 def similarity(a: str, b: str) -> float:
     """Calculate string similarity ratio using SequenceMatcher (0.0 to 1.0)."""
+    # Matchers re-score the same name pairs (candidate ranking, then the
+    # confidence guards), so results are memoized; equal strings skip
+    # SequenceMatcher entirely
+    if a == b:
+        return 1.0
     return SequenceMatcher(None, a, b).ratio()
 
 
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Calibrate the batch-name confidence threshold used by expand_grid_matches.py.
+
+Rows that already carry a Grid match (a "Profile Name" and a positive
+Grid Status) serve as the validation set:
+
+  Positives — each row's Project Name paired with its own Profile Name
+  Negatives — each row's Project Name paired with the most similar
+              Profile Name of a different Grid root (hardest near-collision)
+
+Every pair is scored with expand_grid_matches.compute_confidence(), and
+thresholds from 0.70 to 0.99 are swept for the best F1 (ties go to the
+higher threshold, i.e. precision). The winner is written to
+data/<chain>/grid_thresholds.json, which expand_grid_matches.py reads.
+
+Usage:
+    python scripts/calibrate_threshold.py --chain near --dry-run
+    python scripts/calibrate_threshold.py --chain near
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.csv_utils import load_csv, find_main_csv
+from expand_grid_matches import (
+    POSITIVE_GRID_STATUSES, THRESHOLDS_FILENAME, _STATUS_PREFIX_RE, compute_confidence,
+)
+
+SWEEP = [round(0.70 + i * 0.01, 2) for i in range(30)]  # 0.70 .. 0.99
+
+
+def matched_pairs(rows: List[Dict]) -> List[Tuple[str, List[str], str]]:
+    """(project_name, profile_names, root_id) for rows with a positive Grid match."""
+    pairs = []
+    for row in rows:
+        csv_name = row.get("Project Name", "").strip()
+        profile = row.get("Profile Name", "").strip()
+        grid_status = row.get("The Grid Status", "")
+        if not csv_name or not profile:
+            continue
+        statuses = {_STATUS_PREFIX_RE.sub('', s).strip() for s in grid_status.split(";")}
+        if not (statuses & POSITIVE_GRID_STATUSES or "✅" in grid_status):
+            continue
+        names = [n.strip() for n in profile.split(";") if n.strip()]
+        pairs.append((csv_name, names, row.get("Root ID", "").strip() or profile))
+    return pairs
+
+
+def score_pairs(pairs: List[Tuple[str, List[str], str]]) -> Tuple[List[float], List[float]]:
+    """Confidence scores for the positive and (hardest) negative pairing of each row."""
+    positives, negatives = [], []
+    for csv_name, names, root in pairs:
+        positives.append(max(compute_confidence(csv_name, n) for n in names))
+        others = [
+            compute_confidence(csv_name, n)
+            for _, other_names, other_root in pairs if other_root != root
+            for n in other_names
+        ]
+        if others:
+            negatives.append(max(others))
+    return positives, negatives
+
+
+def sweep(positives: List[float], negatives: List[float]) -> List[Dict]:
+    """Precision/recall/F1 at each SWEEP threshold."""
+    results = []
+    for theta in SWEEP:
+        tp = sum(1 for c in positives if c >= theta)
+        fp = sum(1 for c in negatives if c >= theta)
+        fn = len(positives) - tp
+        precision = tp / (tp + fp) if tp + fp else 1.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        results.append({"threshold": theta, "precision": precision, "recall": recall, "f1": f1})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Calibrate the Grid batch-name confidence threshold"
+    )
+    parser.add_argument("--chain", required=True, help="Chain ID (e.g., near)")
+    parser.add_argument("--csv", help="Path to CSV (auto-detected if omitted)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print the sweep without writing the thresholds file")
+    args = parser.parse_args()
+
+    csv_path = Path(args.csv) if args.csv else find_main_csv(args.chain)
+    if not csv_path or not csv_path.exists():
+        print(f"Error: No CSV found for chain '{args.chain}'")
+        sys.exit(1)
+
+    pairs = matched_pairs(load_csv(csv_path))
+    if len(pairs) < 2:
+        print(f"Error: Need at least 2 matched rows to calibrate, found {len(pairs)}")
+        sys.exit(1)
+
+    positives, negatives = score_pairs(pairs)
+    print(f"\n{len(positives)} positive pairs, {len(negatives)} negative pairs")
+    print(f"\n  {'theta':>5}  {'prec':>5}  {'recall':>6}  {'f1':>5}")
+    results = sweep(positives, negatives)
+    for r in results:
+        print(f"  {r['threshold']:.2f}  {r['precision']:.3f}  {r['recall']:.3f}   {r['f1']:.3f}")
+
+    best = max(results, key=lambda r: (r["f1"], r["threshold"]))
+    print(f"\nBest threshold: {best['threshold']:.2f} (F1 {best['f1']:.3f})")
+
+    if args.dry_run:
+        print(f"\n[DRY RUN] Re-run without --dry-run to write {THRESHOLDS_FILENAME}.")
+        return
+
+    out_path = csv_path.parent / THRESHOLDS_FILENAME
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({"batch-name": best["threshold"]}, f, indent=2)
+        f.write("\n")
+    print(f"Thresholds written to: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,13 +19,13 @@ Usage:
 
 import argparse
 import json
-import re
 import sys
 import time
 import urllib.request
 import urllib.error
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -55,6 +55,22 @@ PLATFORM_TO_ASSET = {
     "cardano": "ADA",
 }
 
+# Lowercased platform keys we care about — intersected with a coin's
+# platforms instead of looking up every deployment it has
+_INTERESTING_PLATFORMS = frozenset(PLATFORM_TO_ASSET)
+
+# Bit per platform-derived asset, derived from PLATFORM_TO_ASSET so a new
+# platform always gets one — lets a coin's deployments be checked against the
+# target list with a single AND instead of walking its platforms
+ASSET_BITS = {a: 1 << i for i, a in enumerate(dict.fromkeys(PLATFORM_TO_ASSET.values()))}
+
+# Notes text per detected deployment, in the order findings are listed
+DEPLOYMENT_NOTES = (
+    ("SOL", "Solana deployment (CoinGecko)"),
+    ("STRK", "Starknet deployment (CoinGecko)"),
+    ("ADA", "Cardano deployment (CoinGecko)"),
+)
+
 # Stablecoin asset keys
 STABLECOIN_KEYS = {"USDT", "USDC"}
 
@@ -68,7 +84,9 @@ def fetch_json(url: str, retries: int = MAX_RETRIES) -> Optional[list]:
                 "Accept": "application/json",
             })
             with urllib.request.urlopen(req, timeout=60) as resp:
-                return json.loads(resp.read().decode("utf-8"))
+                # json.loads detects UTF-8 from raw bytes, skipping a
+                # full decoded copy of the multi-MB coins list
+                return json.loads(resp.read())
         except urllib.error.HTTPError as e:
             if e.code == 429:
                 wait = RETRY_BACKOFF * (2 ** attempt)
@@ -94,26 +112,91 @@ def fetch_json(url: str, retries: int = MAX_RETRIES) -> Optional[list]:
 
 # ── Batch catalog ────────────────────────────────────────────────────────
 
+class CoinEntry(NamedTuple):
+    """
+    Compact catalog record for one CoinGecko coin.
+
+    Shared by every lookup key (name, stripped name, symbol) that points at
+    the coin. asset_mask is the OR of ASSET_BITS for each tracked platform
+    the coin is deployed on, computed once at build time.
+    """
+    id: str
+    name: str
+    symbol: str
+    platforms: dict
+    asset_mask: int
+
+
+def assets_to_mask(assets) -> int:
+    """Fold asset tickers into an ASSET_BITS mask (unknown tickers ignored)."""
+    mask = 0
+    for asset in assets:
+        mask |= ASSET_BITS.get(asset, 0)
+    return mask
+
+
+def platform_asset_mask(platforms: dict) -> int:
+    """Compute the ASSET_BITS mask for a coin's non-empty platform deployments."""
+    return assets_to_mask(
+        PLATFORM_TO_ASSET.get(key.lower(), "")
+        for key, contract in platforms.items() if contract
+    )
+
+
+_NORM_KEEP = frozenset("abcdefghijklmnopqrstuvwxyz0123456789 ")
+
+
+class _NormTable(dict):
+    """
+    str.translate() table for normalize_name: keeps [a-z0-9 ], maps "-" and
+    "_" to a space, and drops every other codepoint. Entries are filled in
+    lazily on first sight so the table covers arbitrary Unicode input.
+    """
+
+    def __missing__(self, codepoint: int):
+        value = codepoint if chr(codepoint) in _NORM_KEEP else None
+        self[codepoint] = value
+        return value
+
+
+# Built once — normalize_name runs for every coin during catalog build, and a
+# single translate() pass replaces two replace() copies plus a regex sub
+_NORM_TABLE = _NormTable({ord("-"): ord(" "), ord("_"): ord(" ")})
+
+
+@lru_cache(maxsize=65536)
 def normalize_name(name: str) -> str:
     """Normalize a project name for matching."""
-    return re.sub(r"[^a-z0-9 ]", "", name.strip().lower().replace("-", " ").replace("_", " "))
+    return name.strip().lower().translate(_NORM_TABLE)
+
+
+_SUFFIXES = frozenset({"dex", "protocol", "finance", "exchange", "network",
+                       "swap", "bridge", "labs", "dao", "wallet", "amm"})
 
 
-def strip_suffixes(name: str) -> str:
-    """Strip common suffixes for matching."""
-    suffixes = {"dex", "protocol", "finance", "exchange", "network",
-                "swap", "bridge", "labs", "dao", "wallet", "amm"}
+def normalize_stripped(name: str, norm: str) -> str:
+    """
+    normalize_name(name) with one trailing _SUFFIXES word dropped, if any.
+
+    ``norm`` is the caller's already-computed normalize_name(name), returned
+    as-is when there is no suffix to strip. The joined words are already
+    lowercased and trimmed, so only the translate step remains.
+    """
     words = name.lower().split()
-    if len(words) > 1 and words[-1] in suffixes:
-        return " ".join(words[:-1])
-    return name
+    if len(words) > 1 and words[-1] in _SUFFIXES:
+        return " ".join(words[:-1]).translate(_NORM_TABLE)
+    return norm
 
 
-def build_coin_catalog() -> Dict[str, dict]:
+def build_coin_catalog() -> Dict[str, CoinEntry]:
     """
     Fetch full CoinGecko coins list with platform data.
-    Returns dict mapping normalized name/symbol → coin entry.
+    Only coins deployed on a PLATFORM_TO_ASSET platform are kept.
+    Returns dict mapping normalized name/symbol → CoinEntry.
     """
+    # Memoized names are only reused within one run; start each build fresh
+    normalize_name.cache_clear()
+
     print("  Fetching CoinGecko coins list (this may take a moment)...", flush=True)
     data = fetch_json(COINS_LIST_URL)
     if not data:
@@ -122,81 +205,119 @@ def build_coin_catalog() -> Dict[str, dict]:
 
     print(f"  Fetched {len(data)} coins from CoinGecko")
 
-    # Build lookup by normalized name and symbol
+    # Build lookup by normalized name and symbol. This loop runs once per
+    # coin (10k+), so it binds hot callables locally and uses setdefault()
+    # for a single hash probe per key (first coin to claim a key wins).
     catalog = {}
+    add = catalog.setdefault
+    norm_name = normalize_name
     for coin in data:
-        name = coin.get("name", "")
-        symbol = coin.get("symbol", "")
-        platforms = coin.get("platforms", {})
+        platforms = coin.get("platforms")
 
         # Skip coins with no platform data
-        if not platforms or not any(v for v in platforms.values()):
+        if not platforms or not any(platforms.values()):
             continue
 
-        entry = {
-            "id": coin.get("id", ""),
-            "name": name,
-            "symbol": symbol,
-            "platforms": platforms,
-        }
+        # Skip coins not deployed on any tracked platform (most are
+        # EVM-only) — they can never enrich a row, and leaving them out
+        # shrinks the fuzzy-match search space
+        asset_mask = platform_asset_mask(platforms)
+        if not asset_mask:
+            continue
+
+        name = coin.get("name", "")
+        symbol = coin.get("symbol", "")
+        entry = CoinEntry(
+            id=coin.get("id", ""),
+            name=name,
+            symbol=symbol,
+            platforms=platforms,
+            asset_mask=asset_mask,
+        )
 
         # Index by normalized name
-        norm = normalize_name(name)
-        if norm and norm not in catalog:
-            catalog[norm] = entry
+        norm = norm_name(name)
+        if norm:
+            add(norm, entry)
 
         # Also index by stripped-suffix name
-        stripped = normalize_name(strip_suffixes(name))
-        if stripped and stripped != norm and stripped not in catalog:
-            catalog[stripped] = entry
+        stripped = normalize_stripped(name, norm)
+        if stripped:
+            add(stripped, entry)
 
         # Index by symbol (lower priority — more ambiguous)
         sym_norm = symbol.strip().lower()
-        if sym_norm and len(sym_norm) >= 3 and sym_norm not in catalog:
-            catalog[sym_norm] = entry
+        if len(sym_norm) >= 3:
+            add(sym_norm, entry)
 
     print(f"  Built catalog with {len(catalog)} lookup entries")
     return catalog
 
 
+# Name separators whose first part is tried as its own lookup key
+_SEPS = (" | ", " - ", " / ")
+
+
+def _candidate_keys(project_name: str, norm: str):
+    """
+    Yield exact-lookup catalog keys for a project name, most specific first.
+
+    Lazy so that the common case (hit on the normalized name) never pays
+    for suffix stripping or separator splits.
+    """
+    # Exact normalized name
+    yield norm
+    # Stripped suffix
+    yield normalize_stripped(project_name, norm)
+    # First part before common separators (handles "RuneMine | Mine Labs")
+    for sep in _SEPS:
+        if sep in project_name:
+            yield normalize_name(project_name.split(sep)[0].strip())
+
+
+def bucket_keys_by_length(catalog: Dict[str, CoinEntry]) -> Dict[int, List[str]]:
+    """Group catalog keys by length for the fuzzy-match length prefilter."""
+    keys_by_len: Dict[int, List[str]] = {}
+    for key in catalog:
+        keys_by_len.setdefault(len(key), []).append(key)
+    return keys_by_len
+
+
 def find_coin_in_catalog(
     project_name: str,
-    catalog: Dict[str, dict],
-    catalog_keys: Optional[List[str]] = None,
+    catalog: Dict[str, CoinEntry],
+    keys_by_len: Optional[Dict[int, List[str]]] = None,
     fuzzy_threshold: float = 0.90,
 ) -> Optional[tuple]:
     """
     Look up a project in the cached CoinGecko catalog.
 
-    Returns (coin_dict, match_method) or None.
+    Returns (CoinEntry, match_method) or None.
     match_method is "exact" for O(1) lookups, "fuzzy" for SequenceMatcher matches.
     """
     from difflib import get_close_matches
 
-    # Try exact normalized name
+    # Exact lookups — one dict probe per candidate key, in priority order
     norm = normalize_name(project_name)
-    if norm in catalog:
-        return catalog[norm], "exact"
-
-    # Try stripped suffix
-    stripped = normalize_name(strip_suffixes(project_name))
-    if stripped in catalog:
-        return catalog[stripped], "exact"
-
-    # Try first part before common separators (handles "RuneMine | Mine Labs")
-    for sep in [" | ", " - ", " / "]:
-        if sep in project_name:
-            first_part = project_name.split(sep)[0].strip()
-            first_norm = normalize_name(first_part)
-            if first_norm and first_norm in catalog:
-                return catalog[first_norm], "exact"
+    for key in _candidate_keys(project_name, norm):
+        entry = catalog.get(key)
+        if entry is not None:
+            return entry, "exact"
 
-    # Fuzzy fallback — only if catalog_keys provided
+    # Fuzzy fallback — only if keys_by_len provided
     # Crypto names are notoriously similar (Bitget/Bitgert, Binance/bAInance)
     # so false positives are common. We use a high threshold and mark results
     # clearly as fuzzy so researchers can verify.
-    if catalog_keys and norm and len(norm) >= 7:
-        matches = get_close_matches(norm, catalog_keys, n=1, cutoff=max(fuzzy_threshold, 0.90))
+    if keys_by_len and norm and len(norm) >= 7:
+        # Only keys passing the length guard below can be returned, so
+        # score just those length buckets rather than the whole catalog
+        n = len(norm)
+        candidates = [
+            key
+            for length in range((3 * n + 3) // 4, (4 * n) // 3 + 1)
+            for key in keys_by_len.get(length, ())
+        ]
+        matches = get_close_matches(norm, candidates, n=1, cutoff=max(fuzzy_threshold, 0.90))
         if matches:
             matched_key = matches[0]
             # Guard: require similar length
@@ -210,20 +331,18 @@ def find_coin_in_catalog(
 # ── Asset detection ──────────────────────────────────────────────────────
 
 def detect_platform_assets(
-    platforms: dict, target_assets: List[str]
+    platforms: dict, target_assets: Set[str]
 ) -> Dict[str, str]:
     """
     Check which target assets are implied by platform deployments.
     Returns dict of {asset: evidence_string}.
     """
+    lowered = {key.lower(): key for key, contract in platforms.items() if contract}
     findings = {}
-    for platform_key, contract in platforms.items():
-        if not contract:
-            continue
-        platform_lower = platform_key.lower()
-        asset = PLATFORM_TO_ASSET.get(platform_lower)
-        if asset and asset in target_assets:
-            findings[asset] = f"deployed on {platform_key}"
+    for platform_lower in sorted(_INTERESTING_PLATFORMS & lowered.keys()):
+        asset = PLATFORM_TO_ASSET[platform_lower]
+        if asset in target_assets:
+            findings[asset] = f"deployed on {lowered[platform_lower]}"
     return findings
 
 
@@ -259,8 +378,10 @@ def enrich_csv(
         print("ERROR: Empty catalog, aborting.")
         return 0, 0, 0
 
-    # Pre-compute catalog keys list for fuzzy matching
-    catalog_keys = list(catalog.keys())
+    # Pre-compute length-bucketed catalog keys for fuzzy matching
+    keys_by_len = bucket_keys_by_length(catalog)
+    target_set = frozenset(target_assets)
+    target_mask = assets_to_mask(target_set)
 
     # Load CSV
     print(f"\nLoading CSV: {csv_path}")
@@ -273,27 +394,39 @@ def enrich_csv(
     enriched = 0
     skipped_incremental = 0
 
+    # Merged CSVs often repeat a project name across rows; match each
+    # distinct name once and reuse the result (including misses)
+    match_cache: Dict[str, Optional[tuple]] = {}
+
     for i, row in enumerate(process_rows):
         name = row.get("Project Name", "").strip()
         if not name:
             continue
 
         # Incremental: skip rows already enriched by CoinGecko
-        if "CoinGecko" in row.get("Evidence & Source URLs", ""):
+        existing_evidence = row.get("Evidence & Source URLs", "")
+        if "CoinGecko" in existing_evidence:
             skipped_incremental += 1
             continue
 
         # O(1) lookup (exact) or fuzzy fallback
-        result = find_coin_in_catalog(name, catalog, catalog_keys=catalog_keys)
+        if name in match_cache:
+            result = match_cache[name]
+        else:
+            result = find_coin_in_catalog(name, catalog, keys_by_len=keys_by_len)
+            match_cache[name] = result
         if not result:
             continue
 
         coin, match_method = result
         cg_matched += 1
 
+        # Cheap bitmask check before walking the coin's platforms
+        if not coin.asset_mask & target_mask:
+            continue
+
         # Detect platform assets
-        platforms = coin.get("platforms", {})
-        platform_findings = detect_platform_assets(platforms, target_assets)
+        platform_findings = detect_platform_assets(coin.platforms, target_set)
 
         if not platform_findings:
             continue
@@ -311,8 +444,8 @@ def enrich_csv(
             # Researchers can verify and promote to high-confidence data.
             asset_list = ", ".join(sorted(all_detected))
             fuzzy_hint = (
-                f"[UNVERIFIED] CoinGecko fuzzy match: \"{coin['name']}\" "
-                f"({coin['id']}) — {asset_list} deployment detected"
+                f"[UNVERIFIED] CoinGecko fuzzy match: \"{coin.name}\" "
+                f"({coin.id}) — {asset_list} deployment detected"
             )
             existing_notes = row.get("Notes", "").strip()
             if existing_notes:
@@ -325,14 +458,13 @@ def enrich_csv(
             # ── EXACT MATCH: write to all high-confidence columns ──
 
             # Build evidence
-            evidence_parts = []
-            for asset in target_assets:
-                if asset in platform_findings:
-                    evidence_parts.append(f"{asset}: {platform_findings[asset]} (CoinGecko)")
-
-            if evidence_parts:
-                evidence = " | ".join(evidence_parts)
-                existing = row.get("Evidence & Source URLs", "").strip()
+            evidence = " | ".join(
+                f"{asset}: {platform_findings[asset]} (CoinGecko)"
+                for asset in target_assets if asset in platform_findings
+            )
+
+            if evidence:
+                existing = existing_evidence.strip()
                 if existing:
                     if "CoinGecko" not in existing:
                         updates["Evidence & Source URLs"] = f"{existing} | {evidence}"
@@ -340,16 +472,11 @@ def enrich_csv(
                     updates["Evidence & Source URLs"] = evidence
 
             # Build notes
-            note_findings = []
-            if "SOL" in all_detected:
-                note_findings.append("Solana deployment (CoinGecko)")
-            if "STRK" in all_detected:
-                note_findings.append("Starknet deployment (CoinGecko)")
-            if "ADA" in all_detected:
-                note_findings.append("Cardano deployment (CoinGecko)")
-
-            if note_findings:
-                finding_text = "; ".join(note_findings)
+            finding_text = "; ".join(
+                note for asset, note in DEPLOYMENT_NOTES if asset in all_detected
+            )
+
+            if finding_text:
                 existing_notes = row.get("Notes", "").strip()
                 if existing_notes:
                     if finding_text not in existing_notes and "CoinGecko" not in existing_notes:
@@ -366,7 +493,7 @@ def enrich_csv(
                     updates["Source"] = "CoinGecko"
 
         match_label = f" [fuzzy]" if is_fuzzy else ""
-        print(f"  {name} -> {coin['name']} ({coin['id']}): {', '.join(sorted(all_detected))}{match_label}")
+        print(f"  {name} -> {coin.name} ({coin.id}): {', '.join(sorted(all_detected))}{match_label}")
 
         if not dry_run:
             row.update(updates)
@@ -15,7 +15,7 @@ Usage:
 import argparse
 import json
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 from urllib.parse import urlparse, parse_qs
@@ -29,13 +29,13 @@ from lib.grid_client import GridAPIClient
 from lib.grid_client.support import (
     TARGET_ASSET_GRID_MAP,
     extract_supported_tickers,
-    check_target_support,
+    target_support_mask,
 )
 
 
 # ── Configuration ──────────────────────────────────────────────────────────
 
-REQUEST_DELAY = 0.2  # seconds between Grid API calls (Grid has no rate limit)
+MAX_WORKERS = 8  # concurrent Grid API calls (Grid has no rate limit)
 
 # Stablecoin asset keys
 STABLECOIN_KEYS = {"USDT", "USDC"}
@@ -54,16 +54,46 @@ def load_chain_config(chain_id: str) -> dict:
     return {}
 
 
+def fetch_root_data(client: GridAPIClient, row: dict) -> List[Dict]:
+    """
+    Fetch Grid root data (with asset support) for a Grid-matched row.
+
+    Query order:
+    1. Root ID (from column or extracted from admin URL) → query by ID
+    2. Normal URL → query by URL
+    """
+    matched_url = row.get("Matched URL", "").strip()
+    root_id = row.get("Root ID", "").strip()
+    if not root_id and matched_url and "admin.thegrid.id" in matched_url:
+        # Extract rootId from admin URL params (e.g., ?rootId=id175446)
+        try:
+            parsed = urlparse(matched_url)
+            root_id = parse_qs(parsed.query).get("rootId", [""])[0]
+        except Exception:
+            pass
+
+    roots = []
+    if root_id:
+        roots = client.get_root_by_id_with_support(root_id)
+    if not roots and matched_url and "admin.thegrid.id" not in matched_url:
+        roots = client.search_with_support_by_url(matched_url)
+    return roots
+
+
 def enrich_from_grid(
     csv_path: Path,
     chain: str,
     target_assets: List[str],
     dry_run: bool = False,
     limit: int = 0,
+    workers: int = MAX_WORKERS,
 ) -> Tuple[int, int, int]:
     """
     Enrich Grid-matched rows with asset support data from the Grid API.
 
+    Grid lookups are I/O-bound, so they run on a thread pool of ``workers``
+    threads. Results are consumed in CSV order to keep output deterministic.
+
     Returns (total_rows, grid_matched_rows, enriched_rows).
     """
     client = GridAPIClient()
@@ -89,91 +119,87 @@ def enrich_from_grid(
     enriched = 0
     skipped_incremental = 0
 
-    for idx, (row_idx, row) in enumerate(grid_rows):
-        name = row.get("Project Name", "").strip()
-        matched_url = row.get("Matched URL", "").strip()
+    # Bit positions follow target_assets (see target_support_mask)
+    target_assets = list(dict.fromkeys(target_assets))
+    usdt_bit = 1 << target_assets.index("USDT") if "USDT" in target_assets else 0
+    usdc_bit = 1 << target_assets.index("USDC") if "USDC" in target_assets else 0
 
-        # Incremental: skip rows already enriched by Grid
-        if "Grid confirms" in row.get("Notes", ""):
+    # Incremental: skip rows already enriched by Grid
+    pending = []
+    for row_idx, row in grid_rows:
+        notes = row.get("Notes", "")
+        if "Grid confirms" in notes:
             skipped_incremental += 1
             continue
-
-        print(f"  [{idx+1}/{len(grid_rows)}] {name}", end="", flush=True)
-
-        # Rate limit
-        if idx > 0:
-            time.sleep(REQUEST_DELAY)
-
-        # Determine the best query method:
-        # 1. Root ID (from column or extracted from admin URL) → query by ID
-        # 2. Normal URL → query by URL
-        root_id = row.get("Root ID", "").strip()
-        if not root_id and matched_url and "admin.thegrid.id" in matched_url:
-            # Extract rootId from admin URL params (e.g., ?rootId=id175446)
-            try:
-                parsed = urlparse(matched_url)
-                root_id = parse_qs(parsed.query).get("rootId", [""])[0]
-            except Exception:
-                pass
-
-        roots = []
-        if root_id:
-            roots = client.get_root_by_id_with_support(root_id)
-        if not roots and matched_url and "admin.thegrid.id" not in matched_url:
-            roots = client.search_with_support_by_url(matched_url)
-        if not roots:
-            print(" -> no root data")
-            continue
-
-        root = roots[0]
-        supported_tickers = extract_supported_tickers(root)
-        target_support = check_target_support(supported_tickers, target_assets)
-
-        supported_list = [a for a, v in target_support.items() if v]
-        if not supported_list:
-            print(" -> no target assets in Grid")
-            continue
-
-        enriched += 1
-
-        # Build updates
-        updates = {}
-
-        # Stablecoin heuristic columns
-        has_usdt = target_support.get("USDT", False)
-        has_usdc = target_support.get("USDC", False)
-        has_any_stablecoin = has_usdt or has_usdc
-
-        if has_any_stablecoin:
-            updates["Suspect USDT support?"] = "TRUE"
-            updates["Web3 but no stablecoin"] = ""
-            if has_usdt and has_usdc:
-                updates["General Stablecoin Adoption"] = "TRUE"
-
-        # Build evidence
-        evidence_parts = [f"{a} (supported_by)" for a in supported_list]
-        evidence_str = f"Grid: {'; '.join(evidence_parts)}"
-
-        existing_evidence = row.get("Evidence & Source URLs", "").strip()
-        if existing_evidence:
-            if "Grid:" not in existing_evidence:
-                updates["Evidence & Source URLs"] = f"{existing_evidence} | {evidence_str}"
-        else:
-            updates["Evidence & Source URLs"] = evidence_str
-
-        # Build notes
-        note_text = f"Grid confirms: {'; '.join(supported_list)}"
-        existing_notes = row.get("Notes", "").strip()
-        if existing_notes:
-            if "Grid confirms" not in existing_notes:
-                updates["Notes"] = f"{existing_notes} | {note_text}"
-        else:
-            updates["Notes"] = note_text
-
-        print(f" -> {', '.join(supported_list)}")
-
-        if not dry_run:
-            rows[row_idx].update(updates)
+        pending.append((row_idx, row, notes))
+
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        results = executor.map(
+            lambda item: fetch_root_data(client, item[1]), pending
+        )
+
+        for idx, ((row_idx, row, notes), roots) in enumerate(zip(pending, results)):
+            name = row.get("Project Name", "").strip()
+            print(f"  [{idx+1}/{len(pending)}] {name}", end="", flush=True)
+
+            if not roots:
+                print(" -> no root data")
+                continue
+
+            root = roots[0]
+            supported_tickers = extract_supported_tickers(root)
+            support_mask = target_support_mask(supported_tickers, target_assets)
+            if not support_mask:
+                print(" -> no target assets in Grid")
+                continue
+
+            supported_list = [
+                a for i, a in enumerate(target_assets) if support_mask >> i & 1
+            ]
+
+            enriched += 1
+
+            # Build updates
+            updates = {}
+
+            # Stablecoin heuristic columns
+            has_usdt = bool(support_mask & usdt_bit)
+            has_usdc = bool(support_mask & usdc_bit)
+            has_any_stablecoin = has_usdt or has_usdc
+
+            if has_any_stablecoin:
+                updates["Suspect USDT support?"] = "TRUE"
+                updates["Web3 but no stablecoin"] = ""
+                if has_usdt and has_usdc:
+                    updates["General Stablecoin Adoption"] = "TRUE"
+
+            # Build evidence
+            evidence_str = "Grid: " + "; ".join(f"{a} (supported_by)" for a in supported_list)
+
+            existing_evidence = row.get("Evidence & Source URLs", "").strip()
+            if existing_evidence:
+                if "Grid:" not in existing_evidence:
+                    updates["Evidence & Source URLs"] = f"{existing_evidence} | {evidence_str}"
+            else:
+                updates["Evidence & Source URLs"] = evidence_str
+
+            # Build notes
+            note_text = "Grid confirms: " + "; ".join(supported_list)
+            existing_notes = notes.strip()
+            if existing_notes:
+                if "Grid confirms" not in existing_notes:
+                    updates["Notes"] = f"{existing_notes} | {note_text}"
+            else:
+                updates["Notes"] = note_text
+
+            print(f" -> {', '.join(supported_list)}")
+
+            if not dry_run:
+                rows[row_idx].update(updates)
+    finally:
+        # Drop queued root fetches so Ctrl-C or an error exits promptly
+        executor.shutdown(wait=False, cancel_futures=True)
 
     if skipped_incremental > 0:
         print(f"\n  Skipped {skipped_incremental} already-enriched rows (incremental)")
@@ -210,6 +236,10 @@ def main():
         "--limit", type=int, default=0,
         help="Process only first N Grid-matched rows (for testing)",
     )
+    parser.add_argument(
+        "--workers", type=int, default=MAX_WORKERS,
+        help=f"Concurrent Grid API requests (default: {MAX_WORKERS})",
+    )
     args = parser.parse_args()
 
     # Resolve target assets
@@ -241,7 +271,7 @@ def main():
 
     total, matched, enriched = enrich_from_grid(
         csv_path, args.chain, target_assets,
-        dry_run=args.dry_run, limit=args.limit,
+        dry_run=args.dry_run, limit=args.limit, workers=args.workers,
     )
 
     print(f"\n{'='*60}")
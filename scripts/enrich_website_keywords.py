@@ -16,22 +16,34 @@ Usage:
 """
 
 import argparse
+import gzip
+import hashlib
+import http.client
+import ipaddress
 import json
+import os
 import re
+import socket
 import ssl
+import string
 import sys
+import tempfile
+import threading
 import time
 import urllib.request
 import urllib.error
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from html import unescape as html_unescape
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urlparse, urljoin
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import quote, urlparse, urljoin
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from lib.csv_utils import load_csv, write_csv, find_main_csv
+from lib.csv_utils import iter_csv, write_csv, find_main_csv
 
 
 # ── Dynamic stablecoin catalog ──────────────────────────────────────────
@@ -45,6 +57,7 @@ def load_dynamic_stablecoins(catalog_path: Path = CATALOG_PATH) -> Dict[str, Lis
 
     Returns dict like {"DAI": ["dai"], "FRAX": ["frax"], "TUSD": ["tusd", "trueusd"]}.
     USDT and USDC are excluded (they have their own hardcoded path).
+    Keywords are lowercased here, once, to match the scanned page text.
     Returns empty dict if catalog is missing or corrupt.
     """
     if not catalog_path.exists():
@@ -60,7 +73,7 @@ def load_dynamic_stablecoins(catalog_path: Path = CATALOG_PATH) -> Dict[str, Lis
                 continue
             keywords = coin.get("keywords", [])
             if keywords:
-                result[symbol] = keywords
+                result[symbol] = [kw.lower() for kw in keywords]
         return result
     except (json.JSONDecodeError, KeyError, TypeError):
         return {}
@@ -93,17 +106,49 @@ WEB3_SIGNAL_KEYWORDS = [
     "lending", "borrow", "staking", "farming", "amm",
     "defi", "decentralized exchange", "liquidity pool",
 ]
+MAX_WEB3_SIGNALS = 5  # web3 keywords reported in a note
 
 # ── HTTP settings ────────────────────────────────────────────────────────
 
 USER_AGENT = "EcosystemResearch/1.0"
 REQUEST_TIMEOUT = 10  # seconds
-REQUEST_DELAY = 0.5   # seconds between requests
+REQUEST_DELAY = 0.5   # seconds between requests to the same host
+MAX_WORKERS = 8       # sites crawled concurrently
+PARSE_PROCESSES = 0   # processes for HTML parsing/scanning (0 = in crawl threads)
 MAX_RETRIES = 1
 MAX_HTML_BYTES = 500_000  # 500KB — plenty for keyword detection
+READ_CHUNK_BYTES = 16_384  # response bodies are read in chunks of this size
+
+HTML_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,*/*",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# SSL context that doesn't verify (some project sites have bad certs).
+# Built once: create_default_context() loads the CA bundle on every call.
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
+MAX_REDIRECTS = 10  # same limit urllib applies
+DNS_CACHE_TTL = 300  # seconds to reuse a resolved host address
+
+# Optional page cache for conditional re-fetches, kept next to the CSV
+PAGE_CACHE_DIRNAME = ".website_cache"
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
 
 # Incremental skip marker
 SCAN_MARKER = "website-scan"
+SCAN_MARKER_SCANNED = f"{SCAN_MARKER}: scanned"  # homepage-only variant
+CHECKPOINT_EVERY = 50  # rows scanned between background CSV checkpoints
+
+# Evidence markers left by stronger sources (Grid, DefiLlama, CoinGecko);
+# rows carrying any of them are not website-scanned
+VERIFIED_EVIDENCE_MARKERS = (
+    "Grid confirms", "DefiLlama", "defillama.com",
+    "CoinGecko", "coingecko.com", "grid.id",
+)
 
 # ── Subpage crawling ────────────────────────────────────────────────────
 
@@ -123,6 +168,13 @@ SCAN_MARKER_CRAWLED_RE = re.compile(r"website-scan: crawled\(\d+\)")
 
 # ── URL validation ───────────────────────────────────────────────────────
 
+# The same homepage/subpage URLs are parsed for eligibility, rate limiting,
+# connection reuse and link dedup; ParseResult is an immutable tuple, so
+# sharing one instance per URL is safe.
+_urlparse = lru_cache(maxsize=8192)(urlparse)
+
+
+@lru_cache(maxsize=4096)
 def is_fetchable_url(url: str) -> bool:
     """Check if a URL is safe to fetch (HTTP/HTTPS, not localhost/IP)."""
     url = url.strip()
@@ -132,13 +184,18 @@ def is_fetchable_url(url: str) -> bool:
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
     try:
-        parsed = urlparse(url)
+        parsed = _urlparse(url)
         host = parsed.hostname or ""
         # Skip localhost, IPs, empty hosts
         if not host or host in ("localhost", "127.0.0.1", "0.0.0.0"):
             return False
-        if host.replace(".", "").isdigit():  # bare IPv4
+        if host.replace(".", "").isdigit():  # bare IPv4, incl. 2130706433 / 127.1 forms
+            return False
+        try:
+            ipaddress.ip_address(host)  # IPv6 literal
             return False
+        except ValueError:
+            pass
         if parsed.scheme not in ("http", "https"):
             return False
         return True
@@ -146,6 +203,7 @@ def is_fetchable_url(url: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=4096)
 def normalize_url_for_fetch(url: str) -> str:
     """Ensure URL has a scheme for fetching."""
     url = url.strip()
@@ -254,19 +312,26 @@ _SKIP_EXTENSIONS = frozenset({
     ".mp4", ".webm", ".mp3", ".xml", ".json", ".rss",
 })
 
-_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+# href of an <a> tag: double-quoted, single-quoted or unquoted value.
+# Anchored on "<a " so <link> stylesheets/icons and "href=" inside other
+# attribute values or inline JSON are not picked up; unquoted values
+# (href=/docs) are matched too.
+_HREF_RE = re.compile(
+    r"""<a\s(?:[^>]*?\s)?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
 
 
 def extract_same_domain_links(
     html: str, base_url: str, max_links: int = MAX_EXTRACTED_LINKS,
 ) -> List[str]:
     """
-    Extract unique same-domain links from HTML using regex.
+    Extract unique same-domain <a href> links from HTML using regex.
 
     Returns absolute URLs on the same domain as base_url.
     Excludes fragment-only links, static assets, mailto/tel, and the homepage itself.
     """
-    parsed_base = urlparse(base_url)
+    parsed_base = _urlparse(base_url)
     base_domain = (parsed_base.hostname or "").lower()
     base_path = parsed_base.path.rstrip("/").lower() or "/"
 
@@ -274,7 +339,11 @@ def extract_same_domain_links(
     results: List[str] = []
 
     for match in _HREF_RE.finditer(html):
-        href = match.group(1).strip()
+        href = (match.group(1) or match.group(2) or match.group(3) or "").strip()
+        if not href:
+            continue
+        if "&" in href:
+            href = html_unescape(href)  # e.g. "&amp;" in query strings
 
         # Skip fragments, mailto, tel, javascript
         if href.startswith(("#", "mailto:", "tel:", "javascript:")):
@@ -282,7 +351,7 @@ def extract_same_domain_links(
 
         # Resolve relative URLs
         absolute = urljoin(base_url, href)
-        parsed = urlparse(absolute)
+        parsed = _urlparse(absolute)
 
         # Same domain only
         if (parsed.hostname or "").lower() != base_domain:
@@ -312,32 +381,285 @@ def extract_same_domain_links(
 
 # ── HTML fetching ────────────────────────────────────────────────────────
 
-def fetch_html(url: str) -> Optional[str]:
+# (host, port) -> (expires_at, getaddrinfo results). Shared by all crawl
+# threads: the same hosts recur across rows, subpages and redirects.
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[float, list]] = {}
+
+
+def _resolve(host: str, port: int) -> list:
+    """socket.getaddrinfo() for a TCP connection, cached for DNS_CACHE_TTL."""
+    now = time.monotonic()
+    cached = _DNS_CACHE.get((host, port))
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    _DNS_CACHE[(host, port)] = (now + DNS_CACHE_TTL, infos)
+    return infos
+
+
+def _create_connection(
+    address: Tuple[str, int], timeout: float, source_address=None,
+) -> socket.socket:
+    """socket.create_connection() that resolves through _resolve()."""
+    host, port = address
+    error: Optional[OSError] = None
+    for family, socktype, proto, _, sockaddr in _resolve(host, port):
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            error = e
+            sock.close()
+    raise error or OSError(f"No addresses found for {host}")
+
+
+# host -> monotonic time its most recent request was scheduled to start.
+# Shared by all crawl threads, so rows on the same host are paced together.
+_HOST_LAST_REQUEST: Dict[str, float] = {}
+_HOST_LAST_REQUEST_LOCK = threading.Lock()
+
+
+def _wait_for_host(url: str) -> None:
+    """Sleep until a request to url's host is REQUEST_DELAY after the last one."""
+    host = (_urlparse(url).hostname or "").lower()
+    with _HOST_LAST_REQUEST_LOCK:
+        now = time.monotonic()
+        start = max(now, _HOST_LAST_REQUEST.get(host, 0.0) + REQUEST_DELAY)
+        _HOST_LAST_REQUEST[host] = start
+    if start > now:
+        time.sleep(start - now)
+
+
+def _read_body(resp, max_bytes: int) -> bytes:
+    """
+    Read up to max_bytes of a response body in READ_CHUNK_BYTES chunks.
+
+    REQUEST_TIMEOUT only bounds each socket read, so a server trickling
+    bytes could hold one read(max_bytes) open far longer; reading stops
+    once the whole body has taken REQUEST_TIMEOUT and keeps what arrived.
+    """
+    chunks: List[bytes] = []
+    total = 0
+    deadline = time.monotonic() + REQUEST_TIMEOUT
+    while total < max_bytes:
+        chunk = resp.read(min(READ_CHUNK_BYTES, max_bytes - total))
+        if not chunk:
+            break
+        chunks.append(chunk)
+        total += len(chunk)
+        if time.monotonic() > deadline:
+            break
+    return b"".join(chunks)
+
+
+class HostConnections:
+    """
+    Keep-alive HTTP(S) connections for one site crawl, keyed by scheme + host.
+
+    A site's subpages share its host, so reusing the connection saves a
+    TCP + TLS handshake per page (urllib opens a new one every request).
+    A connection whose response was not read to the end (body over
+    the byte cap) is dropped rather than reused.
+    """
+
+    def __init__(self):
+        self._conns: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+
+    def _connection(self, key: Tuple[str, str]) -> http.client.HTTPConnection:
+        conn = self._conns.get(key)
+        if conn is None:
+            scheme, netloc = key
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(
+                    netloc, timeout=REQUEST_TIMEOUT, context=_SSL_CTX,
+                )
+            else:
+                conn = http.client.HTTPConnection(netloc, timeout=REQUEST_TIMEOUT)
+            conn._create_connection = _create_connection
+            self._conns[key] = conn
+        return conn
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        conn = self._conns.pop(key, None)
+        if conn is not None:
+            conn.close()
+
+    def _request(
+        self, key: Tuple[str, str], target: str, headers: Dict[str, str],
+    ) -> http.client.HTTPResponse:
+        conn = self._connection(key)
+        reused = conn.sock is not None
+        try:
+            conn.request("GET", target, headers=headers)
+            return conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionError):
+            # The server closed an idle keep-alive connection; reconnect once
+            self._drop(key)
+            if not reused:
+                raise
+            conn = self._connection(key)
+            conn.request("GET", target, headers=headers)
+            return conn.getresponse()
+
+    def get(
+        self, url: str, headers: Dict[str, str] = HTML_HEADERS,
+        max_bytes: int = MAX_HTML_BYTES,
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """
+        GET url, following redirects like urllib.
+        Returns (status, response_headers, body[:max_bytes]).
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            parsed = _urlparse(url)
+            if parsed.scheme not in ("http", "https") or not parsed.netloc:
+                raise ValueError(f"Unsupported URL: {url}")
+            key = (parsed.scheme, parsed.netloc)
+            target = parsed.path or "/"
+            if parsed.query:
+                target += "?" + parsed.query
+            try:
+                resp = self._request(key, target, headers)
+                body = _read_body(resp, max_bytes)
+            except Exception:
+                self._drop(key)
+                raise
+            if not resp.isclosed():
+                self._drop(key)
+            location = resp.getheader("Location")
+            if resp.status in _REDIRECT_CODES and location:
+                # Quote the target the way urllib's redirect handler does
+                location = quote(location, encoding="iso-8859-1", safe=string.punctuation)
+                url = urljoin(url, location)
+                continue
+            return resp.status, resp.msg, body
+        raise ValueError(f"Too many redirects: {url}")
+
+    def close(self) -> None:
+        for key in list(self._conns):
+            self._drop(key)
+
+
+def _is_html_content_type(content_type: str) -> bool:
+    """Accept missing, HTML, or text content types."""
+    if not content_type:
+        return True
+    ct = content_type.lower()
+    return "html" in ct or "text" in ct
+
+
+class PageCache:
+    """
+    On-disk cache of fetched pages for conditional re-fetches.
+
+    Pages whose server sent an ETag or Last-Modified validator are stored
+    (gzipped JSON, one file per URL). A later fetch of the same URL sends
+    If-None-Match / If-Modified-Since, and on 304 Not Modified reuses the
+    stored HTML instead of downloading it again.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json.gz")
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Cached entry for url, or None if missing/unreadable."""
+        try:
+            with gzip.open(self._path(url), "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url: str, headers, html: str) -> None:
+        """Store html if the response headers carry a validator."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "html": html,
+        }
+        # Atomic write, same pattern as write_csv
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        try:
+            with gzip.open(os.fdopen(fd, "wb"), "wt", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(url))
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _conditional_headers(cached: Optional[Dict]) -> Dict[str, str]:
+    """HTML_HEADERS plus the validators of a cached entry."""
+    if not cached:
+        return HTML_HEADERS
+    headers = dict(HTML_HEADERS)
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def fetch_html(
+    url: str,
+    conns: Optional[HostConnections] = None,
+    cache: Optional[PageCache] = None,
+    max_bytes: int = MAX_HTML_BYTES,
+) -> Optional[str]:
     """
     Fetch homepage HTML with retry on 5xx/timeout.
-    Returns HTML string or None on failure.
+    Returns HTML string (at most max_bytes of the body) or None on failure.
+
+    With conns, the request goes over that crawl's keep-alive connections
+    instead of a fresh urllib connection. With cache, the request is
+    conditional on the cached copy, which is returned if unchanged.
     """
     url = normalize_url_for_fetch(url)
-
-    # Create SSL context that doesn't verify (some project sites have bad certs)
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
+    cached = cache.get(url) if cache is not None else None
+    headers = _conditional_headers(cached)
 
     for attempt in range(MAX_RETRIES + 1):
         try:
-            req = urllib.request.Request(url, headers={
-                "User-Agent": USER_AGENT,
-                "Accept": "text/html,application/xhtml+xml,*/*",
-                "Accept-Language": "en-US,en;q=0.9",
-            })
-            with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT, context=ctx) as resp:
-                # Check content type — skip non-HTML
-                ct = resp.headers.get("Content-Type", "")
-                if ct and "html" not in ct.lower() and "text" not in ct.lower():
+            if conns is not None:
+                status, resp_headers, body = conns.get(url, headers, max_bytes)
+                if status == 304 and cached:
+                    return cached["html"]
+                if status >= 300:
+                    if status >= 500 and attempt < MAX_RETRIES:
+                        time.sleep(1)
+                        continue
                     return None
-                return resp.read(MAX_HTML_BYTES).decode("utf-8", errors="ignore")
+                if not _is_html_content_type(resp_headers.get("Content-Type", "")):
+                    return None
+            else:
+                req = urllib.request.Request(url, headers=headers)
+                with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT, context=_SSL_CTX) as resp:
+                    # Check content type — skip non-HTML
+                    resp_headers = resp.headers
+                    if not _is_html_content_type(resp_headers.get("Content-Type", "")):
+                        return None
+                    body = _read_body(resp, max_bytes)
+            html = body.decode("utf-8", errors="ignore")
+            if cache is not None:
+                cache.put(url, resp_headers, html)
+            return html
         except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                return cached["html"]
             if e.code >= 500 and attempt < MAX_RETRIES:
                 time.sleep(1)
                 continue
@@ -352,27 +674,117 @@ def fetch_html(url: str) -> Optional[str]:
 
 # ── HTML → text extraction ───────────────────────────────────────────────
 
-# Regex to strip script/style/noscript blocks
-BLOCK_STRIP_RE = re.compile(
-    r"<\s*(script|style|noscript)[^>]*>.*?</\s*\1\s*>",
-    re.IGNORECASE | re.DOTALL,
-)
+# Opening and closing tags of script/style/noscript blocks, which
+# _strip_blocks removes along with everything between them.
+BLOCK_OPEN_RE = re.compile(r"<\s*(script|style|noscript)[^>]*>", re.IGNORECASE)
+BLOCK_CLOSE_RES = {
+    tag: re.compile(rf"</\s*{tag}\s*>", re.IGNORECASE)
+    for tag in ("script", "style", "noscript")
+}
 
-# Regex to strip all HTML tags
+# Regex to strip all HTML tags. Kept as a separate pass: folding it into
+# the block strip as one alternation measured slower (the block branch is
+# then tried at every "<"), and it would read tags that wrap a stripped
+# block differently on malformed markup.
 TAG_RE = re.compile(r"<[^>]+>")
 
+# The static scan keywords are ASCII, so only A-Z needs folding
+_ASCII_LOWER = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz",
+)
+
+
+def needs_full_lower(dynamic_stablecoins: Optional[Dict[str, List[str]]]) -> bool:
+    """
+    True if any catalog keyword is non-ASCII.
+
+    Catalog keywords come from CoinGecko names, so page text for them must
+    be folded with the full Unicode str.lower() (full_lower=True below).
+    """
+    return any(
+        not kw.isascii()
+        for keywords in (dynamic_stablecoins or {}).values()
+        for kw in keywords
+    )
+
 
-def html_to_text(html: str) -> str:
-    """Strip HTML to plain text for keyword scanning."""
+def _ascii_lower(text: str) -> str:
+    """Lower-case ASCII letters only, skipping the full Unicode case mapping."""
+    if text.isascii():
+        return text.lower()
+    raw = text.encode("utf-8", "surrogatepass").translate(_ASCII_LOWER)
+    return raw.decode("utf-8", "surrogatepass")
+
+
+def _strip_blocks(html: str) -> str:
+    """
+    Replace each script/style/noscript block with a space.
+
+    Same result as a lazy "<script...>.*?</script>" regex substitution
+    (case-insensitive, spanning newlines), but each closing tag is found
+    with one forward search. A tag with no closing tag left in the page
+    has its later openers skipped instead of re-scanned to the end, so a
+    page full of unclosed <script> tags stays linear.
+    """
+    parts: List[str] = []
+    pos = search_from = 0
+    unclosed: Set[str] = set()
+    while True:
+        opening = BLOCK_OPEN_RE.search(html, search_from)
+        if opening is None:
+            break
+        tag = opening.group(1).lower()
+        closing = None if tag in unclosed else BLOCK_CLOSE_RES[tag].search(html, opening.end())
+        if closing is None:
+            # Not a block; the next opener may start inside this tag
+            unclosed.add(tag)
+            search_from = opening.start() + 1
+            continue
+        parts.append(html[pos:opening.start()])
+        parts.append(" ")
+        pos = search_from = closing.end()
+    if not parts:
+        return html
+    parts.append(html[pos:])
+    return "".join(parts)
+
+
+def html_to_text(html: str, full_lower: bool = False) -> str:
+    """
+    Strip HTML to plain text for keyword scanning.
+
+    Only ASCII A-Z is lower-cased unless full_lower is set (see
+    needs_full_lower), which the static keyword lists never need.
+    """
     # Remove script/style/noscript blocks
-    text = BLOCK_STRIP_RE.sub(" ", html)
+    return _blocks_stripped_to_text(_strip_blocks(html), full_lower)
+
+
+def _blocks_stripped_to_text(text: str, full_lower: bool = False) -> str:
+    """html_to_text() after script/style/noscript blocks are removed."""
     # Remove all remaining HTML tags
     text = TAG_RE.sub(" ", text)
     # Decode HTML entities
     text = html_unescape(text)
-    # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text.lower()
+    # Collapse whitespace (str.split uses the same whitespace set as \s)
+    text = " ".join(text.split())
+    return text.lower() if full_lower else _ascii_lower(text)
+
+
+def parse_page(
+    html: str, base_url: Optional[str] = None, full_lower: bool = False,
+) -> Tuple[str, List[str]]:
+    """
+    Convert a page to scan text and, given base_url, its same-domain links.
+
+    Script/style/noscript blocks are stripped once and both outputs are
+    taken from the result, so links are searched for in less text and
+    hrefs inside inline scripts are ignored. Without base_url the link
+    search is skipped (subpages only need text).
+    """
+    stripped = _strip_blocks(html)
+    links = extract_same_domain_links(stripped, base_url) if base_url else []
+    return _blocks_stripped_to_text(stripped, full_lower), links
 
 
 # ── Site crawling ───────────────────────────────────────────────────────
@@ -381,6 +793,10 @@ def crawl_site(
     homepage_url: str,
     crawl_mode: str = DEFAULT_CRAWL_MODE,
     max_subpages: int = DEFAULT_MAX_SUBPAGES,
+    parse: Callable[[str, Optional[str]], Tuple[str, List[str]]] = parse_page,
+    stop_when: Optional[Callable[[str], bool]] = None,
+    cache: Optional[PageCache] = None,
+    max_html_bytes: int = MAX_HTML_BYTES,
 ) -> Tuple[Optional[str], int, int]:
     """
     Crawl a site's homepage and subpages, returning aggregated text.
@@ -389,6 +805,11 @@ def crawl_site(
         homepage_url: The project's main website URL.
         crawl_mode: "homepage", "fixed", "links", or "both".
         max_subpages: Maximum number of subpages to fetch beyond homepage.
+        parse: parse_page() or a stand-in (lets callers offload parsing).
+        stop_when: Called with each page's text; once it returns True no
+            further subpages are fetched.
+        cache: Optional page cache for conditional re-fetches.
+        max_html_bytes: Bytes of each page body to download and scan.
 
     Returns:
         (aggregated_text, pages_fetched, pages_failed)
@@ -396,6 +817,30 @@ def crawl_site(
     """
     homepage_url = normalize_url_for_fetch(homepage_url)
 
+    # Keep-alive connections for this site (urllib is kept when a proxy is
+    # configured, since it honours the proxy environment variables)
+    conns = None if urllib.request.getproxies() else HostConnections()
+    fetch = partial(
+        fetch_html, conns=conns, cache=cache, max_bytes=max_html_bytes,
+    )
+    try:
+        return _crawl_site(
+            homepage_url, crawl_mode, max_subpages, parse, fetch, stop_when,
+        )
+    finally:
+        if conns is not None:
+            conns.close()
+
+
+def _crawl_site(
+    homepage_url: str,
+    crawl_mode: str,
+    max_subpages: int,
+    parse: Callable[[str, Optional[str]], Tuple[str, List[str]]],
+    fetch: Callable[[str], Optional[str]],
+    stop_when: Optional[Callable[[str], bool]] = None,
+) -> Tuple[Optional[str], int, int]:
+    """crawl_site() body, fetching pages with fetch."""
     # ── App store special handling ──
     # App store URLs get description-specific extraction; no subpage crawling.
     store_info = detect_app_store(homepage_url)
@@ -406,7 +851,8 @@ def crawl_site(
             if desc:
                 return desc.lower(), 1, 0
         elif store_type == "google_play":
-            html = fetch_html(homepage_url)
+            _wait_for_host(homepage_url)
+            html = fetch(homepage_url)
             if html:
                 desc = extract_google_play_description(html)
                 if desc:
@@ -422,17 +868,22 @@ def crawl_site(
     all_texts: List[str] = []
 
     # ── Step 1: Fetch homepage ──
-    homepage_html = fetch_html(homepage_url)
+    _wait_for_host(homepage_url)
+    homepage_html = fetch(homepage_url)
     if not homepage_html:
         return None, 0, 1
 
     pages_fetched += 1
-    homepage_text = html_to_text(homepage_html)
+    want_links = crawl_mode in ("links", "both") and max_subpages > 0
+    homepage_text, homepage_links = parse(
+        homepage_html, homepage_url if want_links else None,
+    )
     if len(homepage_text) >= 50:
         all_texts.append(homepage_text)
 
-    # If homepage-only mode, return immediately
-    if crawl_mode == "homepage" or max_subpages <= 0:
+    # If homepage-only mode (or the homepage already has everything), return
+    if (crawl_mode == "homepage" or max_subpages <= 0
+            or (stop_when is not None and stop_when(homepage_text))):
         combined = " ".join(all_texts) if all_texts else None
         return combined, pages_fetched, pages_failed
 
@@ -441,41 +892,39 @@ def crawl_site(
 
     # Fixed common paths
     if crawl_mode in ("fixed", "both"):
-        for subpath in DEFAULT_SUBPATHS:
-            candidate_urls.append(urljoin(homepage_url, subpath))
+        candidate_urls.extend(urljoin(homepage_url, subpath) for subpath in DEFAULT_SUBPATHS)
 
     # Links extracted from homepage HTML
     if crawl_mode in ("links", "both"):
-        extracted = extract_same_domain_links(homepage_html, homepage_url)
-        for link_url in extracted:
-            if link_url not in candidate_urls:
-                candidate_urls.append(link_url)
+        candidate_urls.extend(homepage_links)
 
-    # Deduplicate by normalized path and cap at max_subpages
+    # Deduplicate by normalized path (which also drops repeated URLs) and
+    # stop once max_subpages are picked
     seen_paths: Set[str] = set()
     unique_candidates: List[str] = []
     for url in candidate_urls:
-        parsed = urlparse(url)
-        path_key = (parsed.path or "/").rstrip("/").lower()
+        path_key = (_urlparse(url).path or "/").rstrip("/").lower()
         if path_key and path_key != "/" and path_key not in seen_paths:
             seen_paths.add(path_key)
             unique_candidates.append(url)
-
-    unique_candidates = unique_candidates[:max_subpages]
+            if len(unique_candidates) >= max_subpages:
+                break
 
     # ── Step 3: Fetch subpages ──
     for subpage_url in unique_candidates:
-        time.sleep(REQUEST_DELAY)  # Rate limiting between ALL requests
+        _wait_for_host(subpage_url)  # Rate limiting per host
 
-        sub_html = fetch_html(subpage_url)
+        sub_html = fetch(subpage_url)
         if not sub_html:
             pages_failed += 1
             continue
 
         pages_fetched += 1
-        sub_text = html_to_text(sub_html)
+        sub_text, _ = parse(sub_html)
         if len(sub_text) >= 50:
             all_texts.append(sub_text)
+        if stop_when is not None and stop_when(sub_text):
+            break
 
     combined = " ".join(all_texts) if all_texts else None
     return combined, pages_fetched, pages_failed
@@ -483,6 +932,130 @@ def crawl_site(
 
 # ── Keyword matching ─────────────────────────────────────────────────────
 
+# Short keywords ("usdt", "dex", "amm") need word boundaries to avoid
+# matching inside other words; longer ones use a plain substring test.
+#
+# Instead of one regex scan per short keyword, the page is tokenized once
+# into its set of \w+ runs. A keyword made only of word characters matches
+# \b<kw>\b exactly when it is one of those tokens, so every such keyword
+# becomes an O(1) set lookup. The rare short keyword containing other
+# characters (e.g. "usd+") is located with str.find and accepted when the
+# characters on either side of the hit form a word boundary.
+#
+# Longer keywords stay as individual `in` tests: one combined alternation
+# regex over all of them measured ~3-4x slower on large pages, since re
+# tries every alternative at each position while `in` is a C substring
+# search.
+
+_WORD_RE = re.compile(r"\w+")
+
+_SUBSTRING, _TOKEN, _BOUNDED = "substring", "token", "bounded"
+_MATCHER_COST = {_TOKEN: 0, _SUBSTRING: 1, _BOUNDED: 2}  # relative cost per test
+
+KeywordMatchers = List[Tuple[str, str]]
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same character class as regex \\w."""
+    return ch.isalnum() or ch == "_"
+
+
+def _has_bounded(text: str, keyword: str) -> bool:
+    """True if keyword occurs in text with a \\b on both sides."""
+    first_word = _is_word_char(keyword[0])
+    last_word = _is_word_char(keyword[-1])
+    end_of_text = len(text)
+    start = text.find(keyword)
+    while start != -1:
+        end = start + len(keyword)
+        before = start > 0 and _is_word_char(text[start - 1])
+        after = end < end_of_text and _is_word_char(text[end])
+        if before != first_word and after != last_word:
+            return True
+        start = text.find(keyword, start + 1)
+    return False
+
+
+def _keyword_matchers(keywords: List[str], boundary_max_len: int) -> KeywordMatchers:
+    """Pair each keyword with how to test for it: substring, token, or bounded."""
+    matchers: KeywordMatchers = []
+    for kw in keywords:
+        if len(kw) > boundary_max_len:
+            matchers.append((kw, _SUBSTRING))
+        elif _WORD_RE.fullmatch(kw):
+            matchers.append((kw, _TOKEN))
+        else:
+            matchers.append((kw, _BOUNDED))
+    return matchers
+
+
+@lru_cache(maxsize=None)
+def _dynamic_matchers(keywords: Tuple[str, ...]) -> KeywordMatchers:
+    """Matchers for one catalog stablecoin's keywords, built once per run."""
+    return _keyword_matchers(list(keywords), 5)
+
+
+def _matched_keywords(
+    text: str, tokens: Set[str], matchers: KeywordMatchers, limit: int = 0,
+) -> List[str]:
+    """
+    Return the keywords from matchers that occur in text (tokens = its word runs).
+    With limit > 0, stop as soon as that many have matched.
+    """
+    matched = []
+    for kw, kind in matchers:
+        if kind is _SUBSTRING:
+            hit = kw in text
+        elif kind is _TOKEN:
+            hit = kw in tokens
+        else:
+            hit = _has_bounded(text, kw)
+        if hit:
+            matched.append(kw)
+            if len(matched) == limit:
+                break
+    return matched
+
+
+# html_to_text folds only ASCII A-Z by default, so keywords must already be
+# lowercase ASCII to ever match; checked once here instead of lowering per scan.
+if not all(
+    kw.isascii() and kw == kw.lower()
+    for keywords in (
+        *STABLECOIN_KEYWORDS.values(), *CHAIN_KEYWORDS.values(),
+        GENERIC_STABLECOIN_KEYWORDS, WEB3_SIGNAL_KEYWORDS,
+    )
+    for kw in keywords
+):
+    raise ValueError("scan keywords must be lowercase ASCII")
+
+_STABLECOIN_MATCHERS: Dict[str, KeywordMatchers] = {
+    asset: _keyword_matchers(keywords, 5)
+    for asset, keywords in STABLECOIN_KEYWORDS.items()
+}
+_CHAIN_MATCHERS: Dict[str, KeywordMatchers] = {
+    # Short terms like "sol", "ada" — require word boundary
+    asset: _keyword_matchers(keywords, 4)
+    for asset, keywords in CHAIN_KEYWORDS.items()
+}
+_WEB3_MATCHERS: KeywordMatchers = _keyword_matchers(WEB3_SIGNAL_KEYWORDS, 4)
+
+
+@lru_cache(maxsize=None)
+def _target_matchers(target_assets: Tuple[str, ...]) -> List[Tuple[str, KeywordMatchers]]:
+    """
+    Stablecoin then chain matchers for the target assets only.
+    target_assets is fixed for a run, so this is built once.
+    """
+    targets = frozenset(target_assets)
+    return [
+        (asset, matchers)
+        for asset_matchers in (_STABLECOIN_MATCHERS, _CHAIN_MATCHERS)
+        for asset, matchers in asset_matchers.items()
+        if asset in targets
+    ]
+
+
 def scan_keywords(
     text: str,
     target_assets: List[str],
@@ -495,56 +1068,25 @@ def scan_keywords(
         found_assets: {asset_key: [matched_keywords]}
         found_dynamic_stablecoins: {symbol: [matched_keywords]}
         found_generic_stablecoin: bool
-        found_web3_signal: [matched_keywords]
+        found_web3_signal: [matched_keywords] (at most MAX_WEB3_SIGNALS)
     """
     found_assets: Dict[str, List[str]] = {}
     found_dynamic: Dict[str, List[str]] = {}
-    found_web3: List[str] = []
     found_generic = False
 
-    # Check stablecoin keywords
-    for asset, keywords in STABLECOIN_KEYWORDS.items():
-        if asset not in target_assets:
-            continue
-        matches = []
-        for kw in keywords:
-            # Word boundary match for short terms
-            if len(kw) <= 5:
-                if re.search(r"\b" + re.escape(kw) + r"\b", text):
-                    matches.append(kw)
-            else:
-                if kw in text:
-                    matches.append(kw)
-        if matches:
-            found_assets[asset] = matches
+    # Single tokenizing pass shared by every short-keyword check
+    tokens = set(_WORD_RE.findall(text))
 
-    # Check chain keywords
-    for asset, keywords in CHAIN_KEYWORDS.items():
-        if asset not in target_assets:
-            continue
-        matches = []
-        for kw in keywords:
-            if len(kw) <= 4:
-                # Short terms like "sol", "ada" — require word boundary
-                if re.search(r"\b" + re.escape(kw) + r"\b", text):
-                    matches.append(kw)
-            else:
-                if kw in text:
-                    matches.append(kw)
+    # Check stablecoin keywords, then chain keywords
+    for asset, matchers in _target_matchers(tuple(target_assets)):
+        matches = _matched_keywords(text, tokens, matchers)
         if matches:
             found_assets[asset] = matches
 
     # Check dynamic stablecoin keywords (NOT gated by target_assets)
     if dynamic_stablecoins:
         for symbol, keywords in dynamic_stablecoins.items():
-            matches = []
-            for kw in keywords:
-                if len(kw) <= 5:
-                    if re.search(r"\b" + re.escape(kw) + r"\b", text):
-                        matches.append(kw)
-                else:
-                    if kw in text:
-                        matches.append(kw)
+            matches = _matched_keywords(text, tokens, _dynamic_matchers(tuple(keywords)))
             if matches:
                 found_dynamic[symbol] = matches
 
@@ -554,14 +1096,8 @@ def scan_keywords(
             found_generic = True
             break
 
-    # Web3/DeFi signal
-    for kw in WEB3_SIGNAL_KEYWORDS:
-        if len(kw) <= 4:
-            if re.search(r"\b" + re.escape(kw) + r"\b", text):
-                found_web3.append(kw)
-        else:
-            if kw in text:
-                found_web3.append(kw)
+    # Web3/DeFi signal — only the first few are ever reported
+    found_web3 = _matched_keywords(text, tokens, _WEB3_MATCHERS, limit=MAX_WEB3_SIGNALS)
 
     return {
         "found_assets": found_assets,
@@ -571,6 +1107,55 @@ def scan_keywords(
     }
 
 
+# scan_keywords() arguments of a parse-pool worker, set once per process by
+# _init_scan_worker so each scan only ships the page text.
+_WORKER_SCAN_ARGS: Tuple[List[str], Optional[Dict[str, List[str]]]] = ([], None)
+
+
+def _init_scan_worker(
+    target_assets: List[str], dynamic_stablecoins: Optional[Dict[str, List[str]]],
+) -> None:
+    """ProcessPoolExecutor initializer: store scan settings, build matchers."""
+    global _WORKER_SCAN_ARGS
+    _WORKER_SCAN_ARGS = (target_assets, dynamic_stablecoins)
+    for keywords in (dynamic_stablecoins or {}).values():
+        _dynamic_matchers(tuple(keywords))
+
+
+def _scan_in_worker(text: str) -> Dict:
+    """scan_keywords() with the settings given to _init_scan_worker."""
+    return scan_keywords(text, *_WORKER_SCAN_ARGS)
+
+
+def target_assets_found_check(target_assets: List[str]) -> Optional[Callable[[str], bool]]:
+    """
+    Build a per-site predicate for crawl_site(stop_when=...).
+
+    The predicate is fed each page's text and returns True once every
+    target asset with keywords has matched on some page. Returns None if
+    no target asset has keywords (nothing to wait for).
+    """
+    # Any one hit settles an asset, so try the O(1) token lookups before
+    # substring and boundary searches (match order only matters here, not
+    # in scan_keywords, whose reported keyword lists keep their order)
+    remaining: Dict[str, KeywordMatchers] = {}
+    for asset in target_assets:
+        matchers = _STABLECOIN_MATCHERS.get(asset, []) + _CHAIN_MATCHERS.get(asset, [])
+        if matchers:
+            remaining[asset] = sorted(matchers, key=lambda m: _MATCHER_COST[m[1]])
+    if not remaining:
+        return None
+
+    def all_found(text: str) -> bool:
+        tokens = set(_WORD_RE.findall(text))
+        for asset, matchers in list(remaining.items()):
+            if _matched_keywords(text, tokens, matchers, limit=1):
+                del remaining[asset]
+        return not remaining
+
+    return all_found
+
+
 # ── Note formatting ──────────────────────────────────────────────────────
 
 def format_scan_note(scan_result: Dict) -> str:
@@ -596,7 +1181,7 @@ def format_scan_note(scan_result: Dict) -> str:
 
     # Web3 signal (only if no asset-specific findings — avoid noise)
     if not scan_result["found_assets"] and scan_result["found_web3_signal"]:
-        web3_kws = "; ".join(scan_result["found_web3_signal"][:5])  # cap at 5
+        web3_kws = "; ".join(scan_result["found_web3_signal"][:MAX_WEB3_SIGNALS])
         parts.append(f"web3 signals ({web3_kws})")
 
     if not parts:
@@ -607,6 +1192,22 @@ def format_scan_note(scan_result: Dict) -> str:
 
 # ── Row eligibility ──────────────────────────────────────────────────────
 
+@lru_cache(maxsize=4096)
+def _scan_marker_state(evidence: str) -> Optional[str]:
+    """
+    Classify an Evidence cell's website-scan marker: None (never scanned),
+    "crawled" (crawled(N)), "scanned" (homepage-only) or "marked" (other).
+    Shared by the skipped-row count and should_scan_row().
+    """
+    if SCAN_MARKER not in evidence:
+        return None
+    if SCAN_MARKER_CRAWLED_RE.search(evidence):
+        return "crawled"
+    if SCAN_MARKER_SCANNED in evidence:
+        return "scanned"
+    return "marked"
+
+
 def should_scan_row(row: Dict, rescan_homepage_only: bool = False) -> bool:
     """
     Check if a row should be scanned.
@@ -618,33 +1219,30 @@ def should_scan_row(row: Dict, rescan_homepage_only: bool = False) -> bool:
             with subpage crawling. Rows marked "website-scan: crawled(N)"
             are still skipped.
     """
-    # Must have a website
+    # Must have a website (parsed last, after the cheap Evidence checks)
     website = row.get("Website", "").strip()
-    if not website or not is_fetchable_url(website):
+    if not website:
         return False
 
     # Skip if already scanned (incremental)
     evidence = row.get("Evidence & Source URLs", "")
-    if SCAN_MARKER in evidence:
+    marker_state = _scan_marker_state(evidence)
+    if marker_state is not None:
         if rescan_homepage_only:
             # Re-scan only if it was homepage-only ("scanned"), not "crawled(N)"
-            if SCAN_MARKER_CRAWLED_RE.search(evidence):
+            if marker_state == "crawled":
                 return False  # Already crawled with subpages — skip
             # "website-scan: scanned" → eligible for re-scan, fall through
         else:
             return False
 
     # Skip if already enriched by stronger sources
-    # (Grid, DefiLlama, CoinGecko put their markers in Evidence)
-    if evidence.strip():
-        # Has some evidence — check if it's from a verified source
-        verified_markers = ["Grid confirms", "DefiLlama", "defillama.com",
-                           "CoinGecko", "coingecko.com", "grid.id"]
-        for marker in verified_markers:
-            if marker in evidence:
-                return False
+    # (Grid, DefiLlama, CoinGecko put their markers in Evidence; most rows
+    # have no Evidence at all, so skip the generator for those)
+    if evidence and any(marker in evidence for marker in VERIFIED_EVIDENCE_MARKERS):
+        return False
 
-    return True
+    return is_fetchable_url(website)
 
 
 # ── Main enrichment function ─────────────────────────────────────────────
@@ -658,131 +1256,213 @@ def enrich_csv(
     crawl_mode: str = DEFAULT_CRAWL_MODE,
     max_subpages: int = DEFAULT_MAX_SUBPAGES,
     rescan_homepage_only: bool = False,
+    workers: int = MAX_WORKERS,
+    parse_processes: int = PARSE_PROCESSES,
+    stop_when_found: bool = False,
+    page_cache: bool = False,
+    max_html_bytes: int = MAX_HTML_BYTES,
+    checkpoint_every: int = CHECKPOINT_EVERY,
 ) -> Tuple[int, int, int, int]:
     """
     Enrich CSV with website keyword scan results.
 
+    Sites are crawled concurrently on a pool of ``workers`` threads; requests
+    to any one host stay REQUEST_DELAY apart across all threads. Results
+    are consumed in CSV order, so output is the same as a serial run.
+    With ``parse_processes`` > 0, HTML stripping and keyword scanning are
+    handed to a process pool so they run on multiple cores instead of
+    contending for the GIL inside the crawl threads.
+
     Args:
         crawl_mode: Subpage crawling strategy ("homepage", "fixed", "links", "both").
         max_subpages: Maximum subpages to fetch per site (beyond homepage).
         rescan_homepage_only: Re-scan rows that were only homepage-scanned previously.
+        workers: Number of sites to crawl concurrently.
+        parse_processes: Worker processes for parsing (0 = parse in crawl threads).
+        stop_when_found: Stop crawling a site's subpages once every target
+            asset has matched. Saves requests, but keywords (including
+            dynamic stablecoins) on the skipped pages are not collected.
+        page_cache: Keep fetched pages in PAGE_CACHE_DIRNAME next to the CSV
+            and re-fetch them conditionally (ETag / Last-Modified).
+        max_html_bytes: Bytes of each page body to download and scan.
+        checkpoint_every: Scanned rows between CSV checkpoints (0 = only
+            write at the end).
 
     Returns (total_rows, scanned, keywords_found, fetch_errors).
     """
     print(f"Loading CSV: {csv_path}")
-    rows = load_csv(csv_path)
-    total = len(rows)
+    # Stream the file once, keeping only the rows that will be scanned and
+    # counting already-scanned ones; everything else is copied straight
+    # through on the final rewrite
+    eligible: List[int] = []
+    scan_rows: Dict[int, Dict] = {}
+    total = 0
+    skipped_incremental = 0
+    for i, r in enumerate(iter_csv(csv_path)):
+        total += 1
+        marker_state = _scan_marker_state(r.get("Evidence & Source URLs", ""))
+        if marker_state is not None and not (
+            rescan_homepage_only and marker_state == "scanned"
+        ):
+            skipped_incremental += 1
+        if (limit <= 0 or len(eligible) < limit) and should_scan_row(
+            r, rescan_homepage_only=rescan_homepage_only
+        ):
+            eligible.append(i)
+            scan_rows[i] = r
     print(f"  {total} rows loaded")
     print(f"  Target assets: {', '.join(target_assets)}")
     print(f"  Crawl mode: {crawl_mode} (max {max_subpages} subpages)")
 
     # Load dynamic stablecoin catalog (beyond USDT/USDC)
     dynamic_stablecoins = load_dynamic_stablecoins()
+    full_lower = needs_full_lower(dynamic_stablecoins)
     if dynamic_stablecoins:
         print(f"  Dynamic stablecoin catalog: {len(dynamic_stablecoins)} entries loaded")
     else:
         print(f"  Dynamic stablecoin catalog: not available (scanning USDT/USDC only)")
 
-    # Count eligible rows
-    eligible = [i for i, r in enumerate(rows)
-                if should_scan_row(r, rescan_homepage_only=rescan_homepage_only)]
-    if limit > 0:
-        eligible = eligible[:limit]
     print(f"  {len(eligible)} rows eligible for website scan")
 
     scanned = 0
     keywords_found = 0
     fetch_errors = 0
-    skipped_incremental = sum(
-        1 for r in rows
-        if SCAN_MARKER in r.get("Evidence & Source URLs", "")
-        and not (rescan_homepage_only
-                 and f"{SCAN_MARKER}: scanned" in r.get("Evidence & Source URLs", "")
-                 and not SCAN_MARKER_CRAWLED_RE.search(r.get("Evidence & Source URLs", "")))
-    )
     if skipped_incremental:
         print(f"  {skipped_incremental} rows skipped (already scanned)")
 
-    for idx_num, row_idx in enumerate(eligible):
-        row = rows[row_idx]
-        name = row.get("Project Name", "").strip()
-        website = row.get("Website", "").strip()
+    websites = [scan_rows[i].get("Website", "").strip() for i in eligible]
+
+    cache = PageCache(Path(csv_path).parent / PAGE_CACHE_DIRNAME) if page_cache else None
+    parse_pool = ProcessPoolExecutor(
+        parse_processes,
+        initializer=_init_scan_worker,
+        initargs=(target_assets, dynamic_stablecoins),
+    ) if parse_processes > 0 else None
 
-        print(f"  [{idx_num + 1}/{len(eligible)}] {name} → {website}", end="", flush=True)
+    def parse(html: str, base_url: Optional[str] = None) -> Tuple[str, List[str]]:
+        if parse_pool is None:
+            return parse_page(html, base_url, full_lower)
+        return parse_pool.submit(parse_page, html, base_url, full_lower).result()
 
-        # Rate limiting (between sites; crawl_site handles inter-page delays)
-        if scanned > 0:
-            time.sleep(REQUEST_DELAY)
+    def scan(text: str) -> Dict:
+        if parse_pool is None:
+            return scan_keywords(text, target_assets, dynamic_stablecoins=dynamic_stablecoins)
+        return parse_pool.submit(_scan_in_worker, text).result()
 
-        # Crawl site (homepage + subpages)
+    def crawl(website: str) -> Tuple[Optional[str], int, int, Optional[Dict]]:
         text, pages_fetched, pages_failed = crawl_site(
             website, crawl_mode=crawl_mode, max_subpages=max_subpages,
+            parse=parse, cache=cache, max_html_bytes=max_html_bytes,
+            stop_when=target_assets_found_check(target_assets) if stop_when_found else None,
         )
-        scanned += 1
+        result = scan(text) if text is not None and len(text) >= 50 else None
+        return text, pages_fetched, pages_failed, result
 
-        if text is None:
-            print(" ✗ fetch failed")
-            fetch_errors += 1
-            # Still mark as scanned to avoid re-trying dead sites
-            if not dry_run:
-                _add_scan_marker(row, pages_fetched=0)
-            continue
+    # Periodic checkpoints go through a single background thread so they
+    # run in order and overlap with crawling; a crash keeps finished rows
+    checkpoint_pool = ThreadPoolExecutor(max_workers=1)
+    checkpoint = None
 
-        if len(text) < 50:
-            print(" ✗ too little text")
-            if not dry_run:
-                _add_scan_marker(row, pages_fetched=pages_fetched)
-            continue
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        # Crawl + scan each site in the pool — network-bound, with parsing
+        # optionally offloaded to parse_pool
+        crawls = executor.map(crawl, websites)
+
+        for idx_num, (row_idx, website, crawl_result) in enumerate(
+            zip(eligible, websites, crawls)
+        ):
+            row = scan_rows[row_idx]
+            name = row.get("Project Name", "").strip()
+            text, pages_fetched, pages_failed, result = crawl_result
+
+            print(f"  [{idx_num + 1}/{len(eligible)}] {name} → {website}", end="", flush=True)
+            scanned += 1
+
+            if text is None:
+                print(" ✗ fetch failed")
+                fetch_errors += 1
+                # Still mark as scanned to avoid re-trying dead sites
+                if not dry_run:
+                    _add_scan_marker(row, pages_fetched=0)
+                continue
 
-        # Scan aggregated text for keywords
-        result = scan_keywords(text, target_assets, dynamic_stablecoins=dynamic_stablecoins)
-        note_text = format_scan_note(result)
-
-        if note_text:
-            keywords_found += 1
-            # Show what we found (include dynamic stablecoins)
-            all_asset_keys = list(result["found_assets"].keys()) + list(result.get("found_dynamic_stablecoins", {}).keys())
-            asset_list = ", ".join(all_asset_keys)
-            extras = []
-            if result["found_generic_stablecoin"]:
-                extras.append("stablecoin")
-            if result["found_web3_signal"]:
-                extras.append(f"web3({len(result['found_web3_signal'])})")
-            detail = asset_list
-            if extras:
-                detail += (" + " if detail else "") + ", ".join(extras)
-            page_info = f" [{pages_fetched}pg]" if pages_fetched > 1 else ""
-            print(f" ✓ {detail}{page_info}")
-
-            # Update Notes (append, remove old scan note on re-scan)
+            if len(text) < 50:
+                print(" ✗ too little text")
+                if not dry_run:
+                    _add_scan_marker(row, pages_fetched=pages_fetched)
+                continue
+
+            note_text = format_scan_note(result)
+
+            if note_text:
+                keywords_found += 1
+                # Show what we found (include dynamic stablecoins)
+                all_asset_keys = list(result["found_assets"].keys()) + list(result.get("found_dynamic_stablecoins", {}).keys())
+                asset_list = ", ".join(all_asset_keys)
+                extras = []
+                if result["found_generic_stablecoin"]:
+                    extras.append("stablecoin")
+                if result["found_web3_signal"]:
+                    extras.append(f"web3({len(result['found_web3_signal'])})")
+                detail = asset_list
+                if extras:
+                    detail += (" + " if detail else "") + ", ".join(extras)
+                page_info = f" [{pages_fetched}pg]" if pages_fetched > 1 else ""
+                print(f" ✓ {detail}{page_info}")
+
+                # Update Notes (append, remove old scan note on re-scan)
+                if not dry_run:
+                    existing_notes = row.get("Notes", "").strip()
+                    # On re-scan, remove old website-scan note to avoid duplicates
+                    if rescan_homepage_only and "[UNVERIFIED website-scan]" in existing_notes:
+                        parts = existing_notes.split(" | ")
+                        parts = [p for p in parts if "[UNVERIFIED website-scan]" not in p]
+                        existing_notes = " | ".join(p for p in parts if p.strip())
+                    if existing_notes:
+                        if note_text not in existing_notes:
+                            row["Notes"] = f"{existing_notes} | {note_text}"
+                    else:
+                        row["Notes"] = note_text
+            else:
+                page_info = f" [{pages_fetched}pg]" if pages_fetched > 1 else ""
+                print(f" · no keywords{page_info}")
+
+            # Mark as scanned (regardless of findings)
             if not dry_run:
-                existing_notes = row.get("Notes", "").strip()
-                # On re-scan, remove old website-scan note to avoid duplicates
-                if rescan_homepage_only and "[UNVERIFIED website-scan]" in existing_notes:
-                    parts = existing_notes.split(" | ")
-                    parts = [p for p in parts if "[UNVERIFIED website-scan]" not in p]
-                    existing_notes = " | ".join(p for p in parts if p.strip())
-                if existing_notes:
-                    if note_text not in existing_notes:
-                        row["Notes"] = f"{existing_notes} | {note_text}"
-                else:
-                    row["Notes"] = note_text
-        else:
-            page_info = f" [{pages_fetched}pg]" if pages_fetched > 1 else ""
-            print(f" · no keywords{page_info}")
+                _add_scan_marker(row, pages_fetched=pages_fetched)
 
-        # Mark as scanned (regardless of findings)
-        if not dry_run:
-            _add_scan_marker(row, pages_fetched=pages_fetched)
+            if not dry_run and checkpoint_every > 0 and scanned % checkpoint_every == 0:
+                if checkpoint is not None:
+                    checkpoint.result()
+                snapshot = {i: dict(r) for i, r in scan_rows.items()}
+                checkpoint = checkpoint_pool.submit(_rewrite_csv, csv_path, snapshot)
+    finally:
+        # Drop queued crawls so Ctrl-C or an error exits once the running
+        # ones finish, instead of crawling every remaining site first
+        executor.shutdown(wait=False, cancel_futures=True)
+        if parse_pool is not None:
+            parse_pool.shutdown(cancel_futures=True)
+        checkpoint_pool.shutdown()
+    if checkpoint is not None:
+        checkpoint.result()
 
     # Write CSV
     if not dry_run and scanned > 0:
-        write_csv(rows, csv_path)
+        _rewrite_csv(csv_path, scan_rows)
         print(f"\nEnriched CSV written to: {csv_path}")
 
     return total, scanned, keywords_found, fetch_errors
 
 
+def _rewrite_csv(csv_path: Path, updated_rows: Dict[int, Dict]) -> None:
+    """Rewrite csv_path in place, replacing rows by index from updated_rows."""
+    write_csv(
+        (updated_rows.get(i, r) for i, r in enumerate(iter_csv(csv_path))),
+        csv_path,
+    )
+
+
 def _add_scan_marker(row: Dict, pages_fetched: int = 1) -> None:
     """
     Add the website-scan marker to Evidence for incremental skip.
@@ -801,7 +1481,7 @@ def _add_scan_marker(row: Dict, pages_fetched: int = 1) -> None:
         evidence = " | ".join(p for p in parts if p)
 
     if pages_fetched <= 1:
-        marker = f"{SCAN_MARKER}: scanned"
+        marker = SCAN_MARKER_SCANNED
     else:
         marker = f"{SCAN_MARKER}: crawled({pages_fetched})"
 
@@ -849,6 +1529,23 @@ def main():
                         help="Shortcut for --crawl-mode homepage (disable subpage crawling)")
     parser.add_argument("--rescan-homepage-only", action="store_true",
                         help="Re-scan rows that were only homepage-scanned in a previous run")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS,
+                        help=f"Sites to crawl concurrently (default: {MAX_WORKERS})")
+    parser.add_argument("--parse-processes", type=int, default=PARSE_PROCESSES,
+                        help="Processes for HTML parsing/keyword scanning "
+                             "(default: 0 = parse in crawl threads)")
+    parser.add_argument("--stop-when-found", action="store_true",
+                        help="Stop crawling a site's subpages once every target asset "
+                             "has been found")
+    parser.add_argument("--page-cache", action="store_true",
+                        help=f"Cache fetched pages in <csv dir>/{PAGE_CACHE_DIRNAME} and "
+                             "re-fetch them with conditional requests")
+    parser.add_argument("--max-html-bytes", type=int, default=MAX_HTML_BYTES,
+                        help=f"Bytes of each page to download and scan "
+                             f"(default: {MAX_HTML_BYTES})")
+    parser.add_argument("--checkpoint-every", type=int, default=CHECKPOINT_EVERY,
+                        help=f"Save the CSV every N scanned rows, 0 = only at the end "
+                             f"(default: {CHECKPOINT_EVERY})")
     args = parser.parse_args()
 
     # Resolve crawl mode
@@ -884,7 +1581,10 @@ def main():
         csv_path, args.chain, target_assets,
         dry_run=args.dry_run, limit=args.limit,
         crawl_mode=crawl_mode, max_subpages=args.max_subpages,
-        rescan_homepage_only=args.rescan_homepage_only,
+        rescan_homepage_only=args.rescan_homepage_only, workers=args.workers,
+        parse_processes=args.parse_processes, stop_when_found=args.stop_when_found,
+        page_cache=args.page_cache, max_html_bytes=args.max_html_bytes,
+        checkpoint_every=args.checkpoint_every,
     )
 
     print(f"\n{'='*60}")
@@ -30,28 +30,50 @@ Usage:
 """
 
 import argparse
+import gzip
 import json
+import os
 import re
 import sys
+import tempfile
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from lib.columns import CORRECT_COLUMNS
-from lib.csv_utils import load_csv, write_csv, find_main_csv
+from lib.csv_utils import iter_csv, write_csv, find_main_csv
 from lib.grid_client import GridAPIClient
 from lib.matching import normalize_name, similarity
 
 # ── Constants ──────────────────────────────────────────────────────────
 
 BATCH_SIZE = 500          # Grid API pagination batch size
+PAGES_PER_QUERY = 10      # pages fetched per request as aliased fields
+SOCIALS_BATCH_SIZE = 200  # root IDs per socials lookup (_in filter)
 REQUEST_DELAY = 0.3       # seconds between individual API calls
+SLUG_WORKERS = 4          # threads probing slugs concurrently
 CONFIDENCE_THRESHOLD = 0.85  # minimum confidence for auto-match
+SLUG_CONFIDENCE_THRESHOLD = 0.80  # slightly lower: the slug itself matched
 EXPAND_MARKER = "expanded-grid"  # Evidence marker for incremental skip
 
+# Optional on-disk copy of the downloaded profiles/products, kept next to the CSV
+GRID_CACHE_FILENAME = ".grid_cache.json.gz"
+GRID_CACHE_TTL = 6 * 3600  # seconds before the cached download is refetched
+
+# Optional per-strategy confidence thresholds (written by calibrate_threshold.py)
+THRESHOLDS_FILENAME = "grid_thresholds.json"
+DEFAULT_THRESHOLDS = {
+    "batch-name": CONFIDENCE_THRESHOLD,
+    "slug": SLUG_CONFIDENCE_THRESHOLD,
+}
+
 ALL_STRATEGIES = ["batch-name", "batch-url", "slug", "twitter"]
 
 # Grid statuses that indicate a positive match (row should be skipped by expand).
@@ -61,6 +83,9 @@ POSITIVE_GRID_STATUSES = {
     "Closed", "Dormant", "Archived", "Pending",
 }
 
+# Emoji/punctuation prefix on a Grid Status ("✅ Found" → "Found")
+_STATUS_PREFIX_RE = re.compile(r'^[^\w]+')
+
 # Domains too generic for URL-based matching (social platforms, major chains, etc.)
 EXCLUDED_DOMAINS = {
     "x.com", "twitter.com", "t.me", "telegram.org", "discord.gg", "discord.com",
@@ -74,75 +99,136 @@ EXCLUDED_DOMAINS = {
 # Normalized names too short/generic to safely match
 MIN_NORMALIZED_LEN = 4  # e.g., "bee" (3 chars) is too risky, "near" (4) is borderline
 
+# Words ignored when checking that CSV and Grid names share a word
+NOISE_WORDS = frozenset({"the", "a", "an", "of", "and", "for", "on", "in", "by", "is"})
+
 
 # ── Grid Data Fetching ─────────────────────────────────────────────────
 
-def fetch_all_profiles(client: GridAPIClient) -> List[Dict]:
-    """Fetch all Grid profiles with batch pagination."""
+def _fetch_all_pages(client: GridAPIClient, field: str, selection: str) -> List[Dict]:
+    """
+    Fetch every item of a top-level list field with limit/offset pagination.
+
+    PAGES_PER_QUERY pages are requested per round trip as aliased copies of
+    the field (p0: field(limit, offset: $o0) p1: ...), so a full download
+    takes one or two requests instead of one per BATCH_SIZE page. Offsets
+    are variables, so every round sends the same query text.
+    """
+    params = ", ".join(f"$o{i}: Int" for i in range(PAGES_PER_QUERY))
+    aliases = "\n".join(
+        f"p{i}: {field}(limit: {BATCH_SIZE}, offset: $o{i}) {{ {selection} }}"
+        for i in range(PAGES_PER_QUERY)
+    )
+    query = f"query({params}) {{\n{aliases}\n}}"
+
     all_items = []
     offset = 0
     while True:
-        data = client.raw_query(f"""
-        query {{
-          profileInfos(limit: {BATCH_SIZE}, offset: {offset}) {{
-            id name
-            profileStatus {{ name }}
-            root {{ id slug urlMain }}
-          }}
-        }}
-        """)
-        batch = data.get("profileInfos", [])
-        if not batch:
-            break
-        all_items.extend(batch)
-        offset += BATCH_SIZE
-    return all_items
+        data = client.raw_query(
+            query, {f"o{i}": offset + i * BATCH_SIZE for i in range(PAGES_PER_QUERY)}
+        )
+        for i in range(PAGES_PER_QUERY):
+            batch = data.get(f"p{i}") or []
+            if not batch:
+                return all_items
+            all_items.extend(batch)
+        offset += PAGES_PER_QUERY * BATCH_SIZE
+
+
+def fetch_all_profiles(client: GridAPIClient) -> List[Dict]:
+    """Fetch all Grid profiles with batch pagination."""
+    return _fetch_all_pages(
+        client, "profileInfos",
+        "id name profileStatus { name } root { id slug urlMain }",
+    )
 
 
 def fetch_all_products(client: GridAPIClient) -> List[Dict]:
     """Fetch all Grid products with batch pagination."""
-    all_items = []
-    offset = 0
-    while True:
-        data = client.raw_query(f"""
-        query {{
-          products(limit: {BATCH_SIZE}, offset: {offset}) {{
-            id name
-            productType {{ name }}
-            productStatus {{ name }}
-            root {{ id slug urlMain }}
-          }}
-        }}
-        """)
-        batch = data.get("products", [])
-        if not batch:
-            break
-        all_items.extend(batch)
-        offset += BATCH_SIZE
-    return all_items
+    return _fetch_all_pages(
+        client, "products",
+        "id name productType { name } productStatus { name } root { id slug urlMain }",
+    )
+
+
+def load_grid_cache(path: Path, ttl: float = GRID_CACHE_TTL) -> Optional[Tuple[List[Dict], List[Dict]]]:
+    """(profiles, products) from a cache file younger than ttl seconds, else None."""
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        return data["profiles"], data["products"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
 
 
-def fetch_root_socials(client: GridAPIClient, root_id: str) -> List[Dict]:
-    """Fetch socials for a specific root."""
+def save_grid_cache(path: Path, profiles: List[Dict], products: List[Dict]) -> None:
+    """Write the downloaded profiles/products to path (atomic, best effort)."""
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=path.parent)
+    try:
+        with gzip.open(os.fdopen(fd, "wb"), "wt", encoding="utf-8") as f:
+            json.dump({"profiles": profiles, "products": products}, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def fetch_socials_bulk(client: GridAPIClient, root_ids: List[str]) -> Dict[str, List[Dict]]:
+    """Fetch socials for up to SOCIALS_BATCH_SIZE roots in one query (root_id → socials)."""
     data = client.raw_query("""
-    query($rootId: String!) {
-      roots(where: { id: { _eq: $rootId } }, limit: 1) {
+    query($rootIds: [String!], $limit: Int) {
+      roots(where: { id: { _in: $rootIds } }, limit: $limit) {
+        id
         socials { name socialType { name } }
       }
     }
-    """, {"rootId": root_id})
-    roots = data.get("roots", [])
-    if roots:
-        return roots[0].get("socials", [])
-    return []
+    """, {"rootIds": root_ids, "limit": len(root_ids)})
+    return {r.get("id", ""): r.get("socials") or [] for r in data.get("roots", [])}
 
 
 # ── Index Building ─────────────────────────────────────────────────────
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_NON_ALNUM_SPACE_RE = re.compile(r"[^a-z0-9 ]")
+
+
+@lru_cache(maxsize=None)
+def _raw(name: str) -> str:
+    """Lowercased alphanumerics only ("Ref Finance" → "reffinance"), cached per name."""
+    return _NON_ALNUM_RE.sub("", name.lower())
+
+
+@lru_cache(maxsize=None)
+def _name_forms(name: str) -> Tuple[str, str, FrozenSet[str]]:
+    """
+    (normalized, raw alphanum, meaningful words) for a name, cached per name.
+
+    Everything the batch-name confidence check and guards compare, derived
+    from one lowercasing so each name is analysed once.
+    """
+    lowered = name.lower()
+    raw = _NON_ALNUM_RE.sub("", lowered)
+    words = frozenset(_NON_ALNUM_SPACE_RE.sub("", lowered).split()) - NOISE_WORDS
+    return normalize_name(name), raw, words
+
+
+# Plain http(s) URLs / bare hosts, whose host urlparse would return as-is
+_SIMPLE_URL_RE = re.compile(r"(https?://)?([A-Za-z0-9.-]+(?::[0-9]+)?)(?:[/?#]|$)")
+
+
+@lru_cache(maxsize=None)
 def extract_domain(url: str) -> str:
-    """Extract clean domain from URL (no www, no protocol)."""
+    """Extract clean domain from URL (no www, no protocol), cached per URL."""
     if not url:
         return ""
+    # Fast path for the common case; anything unusual goes through urlparse
+    m = _SIMPLE_URL_RE.match(url)
+    if m and (m.group(1) or "://" not in url):
+        return m.group(2).lower().replace("www.", "")
     try:
         parsed = urlparse(url if "://" in url else f"https://{url}")
         domain = parsed.netloc or parsed.path.split("/")[0]
@@ -152,61 +238,58 @@ def extract_domain(url: str) -> str:
         return ""
 
 
-def build_name_index(profiles: List[Dict], products: List[Dict]) -> Dict[str, List[Dict]]:
-    """
-    Build a normalized-name → [grid_entry] lookup.
-    Each entry has: name, grid_type, grid_id, status, root_slug, root_url, root_id
-    """
-    index: Dict[str, List[Dict]] = {}
-
-    for p in profiles:
+def _name_entries(items: List[Dict], grid_type: str) -> Iterator[Dict]:
+    """Yield a name-index entry for each named Grid profile or product."""
+    for p in items:
         name = p.get("name", "").strip()
         if not name or len(name) < 2:
             continue
         root = p.get("root") or {}
-        status = (p.get("profileStatus") or {}).get("name", "")
+        if grid_type == "profile":
+            status = (p.get("profileStatus") or {}).get("name", "")
+        else:
+            status = (p.get("productStatus") or {}).get("name", "")
         entry = {
             "name": name,
-            "grid_type": "profile",
+            "grid_type": grid_type,
             "grid_id": p.get("id", ""),
             "status": status,
-            "root_slug": root.get("slug", ""),
-            "root_url": root.get("urlMain", ""),
-            "root_id": root.get("id", ""),
         }
-        norm = normalize_name(name)
-        if norm:
-            index.setdefault(norm, []).append(entry)
-        # Also index the raw lowered name (no suffix stripping)
-        raw = re.sub(r"[^a-z0-9]", "", name.lower())
-        if raw and raw != norm:
-            index.setdefault(raw, []).append(entry)
+        if grid_type == "product":
+            entry["product_type"] = (p.get("productType") or {}).get("name", "")
+        entry["root_slug"] = root.get("slug", "")
+        entry["root_url"] = root.get("urlMain", "")
+        entry["root_id"] = root.get("id", "")
+        yield entry
 
-    for p in products:
-        name = p.get("name", "").strip()
-        if not name or len(name) < 2:
+
+def build_name_index(profiles: List[Dict], products: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Build a normalized-name → [grid_entry] lookup.
+    Each entry has: name, grid_type, grid_id, status, root_slug, root_url, root_id
+
+    Entries that would write the same match (same root, type, name, status
+    and product type — only grid_id differs) are indexed once.
+    """
+    index: Dict[str, List[Dict]] = defaultdict(list)
+    seen: Set[Tuple] = set()
+
+    for entry in chain(_name_entries(profiles, "profile"), _name_entries(products, "product")):
+        name = entry["name"]
+        ident = (entry["root_id"], entry["grid_type"], name, entry["status"], entry.get("product_type"))
+        if ident in seen:
             continue
-        root = p.get("root") or {}
-        ptype = (p.get("productType") or {}).get("name", "")
-        status = (p.get("productStatus") or {}).get("name", "")
-        entry = {
-            "name": name,
-            "grid_type": "product",
-            "grid_id": p.get("id", ""),
-            "status": status,
-            "product_type": ptype,
-            "root_slug": root.get("slug", ""),
-            "root_url": root.get("urlMain", ""),
-            "root_id": root.get("id", ""),
-        }
+        seen.add(ident)
+
         norm = normalize_name(name)
         if norm:
-            index.setdefault(norm, []).append(entry)
-        raw = re.sub(r"[^a-z0-9]", "", name.lower())
+            index[norm].append(entry)
+        # Also index the raw lowered name (no suffix stripping)
+        raw = _raw(name)
         if raw and raw != norm:
-            index.setdefault(raw, []).append(entry)
+            index[raw].append(entry)
 
-    return index
+    return dict(index)
 
 
 def build_url_index(profiles: List[Dict], products: List[Dict]) -> Dict[str, List[Dict]]:
@@ -257,6 +340,8 @@ def pick_best_entry(candidates: List[Dict], csv_name: str) -> Optional[Dict]:
     if len(candidates) == 1:
         return candidates[0]
 
+    csv_raw = _raw(csv_name)
+
     def score(entry):
         s = 0.0
         # Prefer profiles over products
@@ -268,28 +353,26 @@ def pick_best_entry(candidates: List[Dict], csv_name: str) -> Optional[Dict]:
         elif entry.get("status") == "Live":
             s += 0.8
         # Name similarity bonus
-        sim = similarity(
-            re.sub(r"[^a-z0-9]", "", entry.get("name", "").lower()),
-            re.sub(r"[^a-z0-9]", "", csv_name.lower()),
-        )
+        sim = similarity(_raw(entry.get("name", "")), csv_raw)
         s += sim
         return s
 
+    # Kept as an in-place stable sort rather than max(): candidates is a
+    # shared index list, and tie-breaking depends on the order earlier
+    # calls left it in
     candidates.sort(key=score, reverse=True)
     return candidates[0]
 
 
 def compute_confidence(csv_name: str, grid_name: str) -> float:
     """Compute match confidence between CSV name and Grid name."""
-    norm_csv = normalize_name(csv_name)
-    norm_grid = normalize_name(grid_name)
+    norm_csv, raw_csv, _ = _name_forms(csv_name)
+    norm_grid, raw_grid, _ = _name_forms(grid_name)
 
     if norm_csv == norm_grid:
         return 1.0
 
     # Raw alphanum comparison
-    raw_csv = re.sub(r"[^a-z0-9]", "", csv_name.lower())
-    raw_grid = re.sub(r"[^a-z0-9]", "", grid_name.lower())
     if raw_csv == raw_grid:
         return 0.98
 
@@ -301,9 +384,25 @@ def compute_confidence(csv_name: str, grid_name: str) -> float:
     return similarity(norm_csv, norm_grid)
 
 
+def load_thresholds(path: Path) -> Dict[str, float]:
+    """DEFAULT_THRESHOLDS overridden by any numeric entries in a thresholds JSON file."""
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return thresholds
+    if isinstance(data, dict):
+        for method, value in data.items():
+            if method in thresholds and isinstance(value, (int, float)):
+                thresholds[method] = float(value)
+    return thresholds
+
+
 def strategy_batch_name(
     unmatched: List[Tuple[int, Dict]],
     name_index: Dict[str, List[Dict]],
+    threshold: float = CONFIDENCE_THRESHOLD,
 ) -> List[Tuple[int, Dict, str, float]]:
     """
     Strategy 1: Match CSV names against batch-downloaded Grid profiles + products.
@@ -315,19 +414,17 @@ def strategy_batch_name(
         if not csv_name:
             continue
 
-        # Try normalized name
-        norm = normalize_name(csv_name)
+        # Try normalized name; the raw alphanum form is the index fallback
+        # here and feeds Guards 2/3 below
+        norm, raw_csv, csv_meaningful = _name_forms(csv_name)
         if len(norm) < MIN_NORMALIZED_LEN:
             continue  # Too short to match safely
 
-        candidates = name_index.get(norm, [])
-
-        # Also try raw alphanum
-        if not candidates:
-            raw = re.sub(r"[^a-z0-9]", "", csv_name.lower())
-            if len(raw) >= MIN_NORMALIZED_LEN:
-                candidates = name_index.get(raw, [])
-
+        # Most rows have no Grid name at all; settle those with one or two
+        # dict probes before any similarity work
+        candidates = name_index.get(norm)
+        if not candidates and len(raw_csv) >= MIN_NORMALIZED_LEN:
+            candidates = name_index.get(raw_csv)
         if not candidates:
             continue
 
@@ -337,26 +434,23 @@ def strategy_batch_name(
 
         # Extra validation: if the raw names differ significantly, skip
         conf = compute_confidence(csv_name, best["name"])
-        if conf < CONFIDENCE_THRESHOLD:
+        if conf < threshold:
             continue
 
         # Guard 1: if CSV name has extra meaningful words beyond the Grid name,
         # it might be a different project (e.g., "Moon Shot" != "Moonshot" if URLs differ)
-        csv_words = set(re.sub(r"[^a-z0-9 ]", "", csv_name.lower()).split())
-        grid_words = set(re.sub(r"[^a-z0-9 ]", "", best["name"].lower()).split())
-        noise = {"the", "a", "an", "of", "and", "for", "on", "in", "by", "is"}
-        csv_meaningful = csv_words - noise
-        grid_meaningful = grid_words - noise
+        # (Still applies when the raw forms are equal: "Moon Shot" vs "Moonshot")
+        _, raw_grid, grid_meaningful = _name_forms(best["name"])
         if csv_meaningful and grid_meaningful:
-            overlap = csv_meaningful & grid_meaningful
-            if not overlap:
+            if csv_meaningful.isdisjoint(grid_meaningful):
                 continue  # No word overlap at all — likely different projects
 
-        # Guard 2: If the raw (non-normalized) names differ AND both have URLs,
-        # cross-check domains to catch false positives like "Flux Protocol" ≠ "Flux Finance"
-        raw_csv = re.sub(r"[^a-z0-9]", "", csv_name.lower())
-        raw_grid = re.sub(r"[^a-z0-9]", "", best["name"].lower())
+        # Guards 2 and 3 only apply when the raw names differ
         if raw_csv != raw_grid:
+            raw_sim = None
+
+            # Guard 2: If both have URLs, cross-check domains to catch false
+            # positives like "Flux Protocol" ≠ "Flux Finance"
             csv_url = row.get("Website", "").strip()
             grid_url = best.get("root_url", "")
             if csv_url and grid_url:
@@ -369,13 +463,14 @@ def strategy_batch_name(
                     if raw_sim < 0.90:
                         continue
 
-        # Guard 3: If normalization stripped important suffixes (wallet, protocol, etc.)
-        # and the raw names differ, require higher confidence
-        if norm != raw_csv and raw_csv != raw_grid:
-            # Normalization removed something meaningful — be extra careful
-            raw_sim = similarity(raw_csv, raw_grid)
-            if raw_sim < 0.85:
-                continue
+            # Guard 3: If normalization stripped important suffixes (wallet,
+            # protocol, etc.), require higher confidence
+            if norm != raw_csv:
+                # Normalization removed something meaningful — be extra careful
+                if raw_sim is None:
+                    raw_sim = similarity(raw_csv, raw_grid)
+                if raw_sim < 0.85:
+                    continue
 
         results.append((row_idx, best, "batch-name", conf))
 
@@ -402,7 +497,7 @@ def strategy_batch_url(
         if domain in EXCLUDED_DOMAINS:
             continue
 
-        candidates = url_index.get(domain, [])
+        candidates = url_index.get(domain)
         if not candidates:
             continue
 
@@ -416,55 +511,66 @@ def strategy_batch_url(
     return results
 
 
-def strategy_slug(
-    unmatched: List[Tuple[int, Dict]],
-    client: GridAPIClient,
-    already_matched: Set[int],
-) -> List[Tuple[int, Dict, str, float]]:
-    """
-    Strategy 3: Generate candidate slugs from name and query Grid directly.
-    """
-    results = []
+def _probe_slugs(client: GridAPIClient, row: Dict, threshold: float) -> Optional[Tuple[Dict, float]]:
+    """Try a row's candidate slugs in order; return (entry, confidence) for the first match."""
+    csv_name = row.get("Project Name", "").strip()
 
-    for row_idx, row in unmatched:
-        if row_idx in already_matched:
+    for slug in _generate_slugs(csv_name, row.get("Website", "")):
+        if len(slug) < 3:
             continue
 
-        csv_name = row.get("Project Name", "").strip()
-        if not csv_name:
+        client.wait_for_request_slot(REQUEST_DELAY)
+        root = client.get_root_with_support(slug)
+        if not root:
             continue
 
-        # Generate slug candidates
-        slugs = _generate_slugs(csv_name, row.get("Website", ""))
+        pis = root.get("profileInfos", [])
+        name = pis[0].get("name", slug) if pis else slug
+        status_obj = pis[0].get("profileStatus", {}) if pis else {}
+        status = status_obj.get("name", "") if isinstance(status_obj, dict) else ""
 
-        for slug in slugs:
-            if len(slug) < 3:
-                continue
+        entry = {
+            "name": name,
+            "grid_type": "profile" if pis else "root",
+            "grid_id": pis[0].get("id", "") if pis else root.get("id", ""),
+            "status": status,
+            "root_slug": root.get("slug", slug),
+            "root_url": root.get("urlMain", ""),
+            "root_id": root.get("id", ""),
+        }
 
-            time.sleep(REQUEST_DELAY)
-            root = client.get_root_with_support(slug)
-            if not root:
-                continue
+        conf = compute_confidence(csv_name, name)
+        if conf >= threshold:
+            return entry, conf  # Found one, move to next row
 
-            pis = root.get("profileInfos", [])
-            name = pis[0].get("name", slug) if pis else slug
-            status_obj = pis[0].get("profileStatus", {}) if pis else {}
-            status = status_obj.get("name", "") if isinstance(status_obj, dict) else ""
+    return None
 
-            entry = {
-                "name": name,
-                "grid_type": "profile" if pis else "root",
-                "grid_id": pis[0].get("id", "") if pis else root.get("id", ""),
-                "status": status,
-                "root_slug": root.get("slug", slug),
-                "root_url": root.get("urlMain", ""),
-                "root_id": root.get("id", ""),
-            }
 
-            conf = compute_confidence(csv_name, name)
-            if conf >= 0.80:  # Slightly lower threshold for slug matches
+def strategy_slug(
+    unmatched: List[Tuple[int, Dict]],
+    client: GridAPIClient,
+    already_matched: Set[int],
+    threshold: float = SLUG_CONFIDENCE_THRESHOLD,
+) -> List[Tuple[int, Dict, str, float]]:
+    """
+    Strategy 3: Generate candidate slugs from name and query Grid directly.
+
+    Rows are probed on SLUG_WORKERS threads so API round trips overlap;
+    calls still start at most one per REQUEST_DELAY overall, and each
+    row's slugs are tried in order until the first match.
+    """
+    rows = [
+        (row_idx, row) for row_idx, row in unmatched
+        if row_idx not in already_matched and row.get("Project Name", "").strip()
+    ]
+
+    results = []
+    with ThreadPoolExecutor(max_workers=SLUG_WORKERS) as pool:
+        hits = pool.map(lambda item: _probe_slugs(client, item[1], threshold), rows)
+        for (row_idx, _), hit in zip(rows, hits):
+            if hit:
+                entry, conf = hit
                 results.append((row_idx, entry, "slug", conf))
-                break  # Found one, move to next row
 
     return results
 
@@ -491,21 +597,30 @@ def strategy_twitter(
     if not handle_to_rows:
         return []
 
-    # Fetch Twitter socials for all Grid roots (paginated)
-    # Only fetch roots that have profiles (not orphan products)
-    results = []
+    # One (profile, root) per Grid root that has a profile (not orphan products)
+    profile_roots: List[Tuple[Dict, Dict]] = []
     seen_roots: Set[str] = set()
-
     for profile in profiles:
         root = profile.get("root") or {}
         root_id = root.get("id", "")
         if not root_id or root_id in seen_roots:
             continue
         seen_roots.add(root_id)
+        profile_roots.append((profile, root))
 
-        # Fetch socials
-        time.sleep(REQUEST_DELAY)
-        socials = fetch_root_socials(client, root_id)
+    # Fetch socials SOCIALS_BATCH_SIZE roots at a time, in profile order: the
+    # first root (in that order) whose handle matches case-insensitively
+    # wins, so every root up to the last match has to be read in full
+    results = []
+    pending = sum(len(rows) for rows in handle_to_rows.values())  # rows still unmatched
+    socials_by_root: Dict[str, List[Dict]] = {}
+    for pos, (profile, root) in enumerate(profile_roots):
+        root_id = root["id"]
+        if pos % SOCIALS_BATCH_SIZE == 0:
+            time.sleep(REQUEST_DELAY)
+            chunk = profile_roots[pos:pos + SOCIALS_BATCH_SIZE]
+            socials_by_root = fetch_socials_bulk(client, [r["id"] for _, r in chunk])
+        socials = socials_by_root.get(root_id)
         if not socials:
             continue
 
@@ -532,31 +647,39 @@ def strategy_twitter(
                     }
                     results.append((row_idx, entry, "twitter", 0.92))
                     already_matched.add(row_idx)
+                    pending -= 1
 
         # Early exit if all handles matched
-        all_matched = all(
-            all(ri in already_matched for ri, _ in rows)
-            for rows in handle_to_rows.values()
-        )
-        if all_matched:
+        if not pending:
             break
 
     return results
 
 
+# Separator folding for slug candidates (one C-level pass instead of .replace chains)
+_TO_UNDERSCORES = str.maketrans(" -", "__")
+_TO_HYPHENS = str.maketrans(" _", "--")
+_DOMAIN_TO_UNDERSCORES = str.maketrans(".-", "__")
+_NON_UNDERSCORE_SLUG_RE = re.compile(r"[^a-z0-9_]+")
+_NON_HYPHEN_SLUG_RE = re.compile(r"[^a-z0-9-]+")
+_UNDERSCORE_RUN_RE = re.compile(r"__+")
+_HYPHEN_RUN_RE = re.compile(r"--+")
+
+
 def _generate_slugs(name: str, website: str = "") -> List[str]:
     """Generate candidate Grid slugs from project name and website."""
     slugs = []
+    lowered = name.lower()
 
     # From name: lowercase, replace spaces with underscores
-    slug1 = re.sub(r"[^a-z0-9_]", "", name.lower().replace(" ", "_").replace("-", "_"))
-    slug1 = re.sub(r"_+", "_", slug1).strip("_")
+    slug1 = _NON_UNDERSCORE_SLUG_RE.sub("", lowered.translate(_TO_UNDERSCORES))
+    slug1 = _UNDERSCORE_RUN_RE.sub("_", slug1).strip("_")
     if slug1:
         slugs.append(slug1)
 
     # From name: hyphenated
-    slug2 = re.sub(r"[^a-z0-9-]", "", name.lower().replace(" ", "-").replace("_", "-"))
-    slug2 = re.sub(r"-+", "-", slug2).strip("-")
+    slug2 = _NON_HYPHEN_SLUG_RE.sub("", lowered.translate(_TO_HYPHENS))
+    slug2 = _HYPHEN_RUN_RE.sub("-", slug2).strip("-")
     if slug2 and slug2 != slug1:
         slugs.append(slug2)
 
@@ -565,8 +688,8 @@ def _generate_slugs(name: str, website: str = "") -> List[str]:
         domain = extract_domain(website)
         if domain:
             # e.g., "ref.finance" → "ref_finance"
-            slug3 = domain.replace(".", "_").replace("-", "_")
-            slug3 = re.sub(r"_+", "_", slug3).strip("_")
+            slug3 = domain.translate(_DOMAIN_TO_UNDERSCORES)
+            slug3 = _UNDERSCORE_RUN_RE.sub("_", slug3).strip("_")
             if slug3 and slug3 not in slugs:
                 slugs.append(slug3)
             # Also try domain without TLD
@@ -627,33 +750,41 @@ def expand_matches(
     strategies: List[str],
     dry_run: bool = False,
     limit: int = 0,
+    grid_cache: bool = False,
 ) -> Tuple[int, int, int, Dict[str, int]]:
     """
     Expand Grid matches using multiple strategies.
 
+    With grid_cache, the profile/product download is stored in
+    GRID_CACHE_FILENAME next to the CSV and reused for GRID_CACHE_TTL.
+    Confidence thresholds come from THRESHOLDS_FILENAME next to the CSV
+    when present (see calibrate_threshold.py), else DEFAULT_THRESHOLDS.
+
     Returns (total_rows, unmatched_before, newly_matched, strategy_counts).
     """
     client = GridAPIClient()
 
     print(f"\nLoading CSV: {csv_path}")
-    rows = load_csv(csv_path)
-    total = len(rows)
-
     # Identify unmatched rows — only skip rows with a POSITIVE Grid Status
     # or an expand marker from a previous run.
     # Researcher data may have "❌ Not found" or other negative statuses —
     # these should NOT be treated as matched.
+    # Only unmatched rows are kept in memory; the rest are streamed past
+    # here and again when the CSV is rewritten.
+    total = 0
     unmatched = []
-    for i, row in enumerate(rows):
+    for i, row in enumerate(iter_csv(csv_path)):
+        total += 1
+        if EXPAND_MARKER in row.get("Evidence & Source URLs", ""):
+            continue
         grid_status = row.get("The Grid Status", "").strip()
         if grid_status:
-            # Strip emoji prefixes (e.g., "✅ Found" → "Found", "❌ Not found" → "Not found")
-            clean_status = re.sub(r'^[^\w]+', '', grid_status).strip()
-            # Skip if it's a known positive status OR has ✅ emoji
-            if clean_status in POSITIVE_GRID_STATUSES or "✅" in grid_status:
+            # Skip if it has ✅ emoji OR is a known positive status once the
+            # emoji prefix is stripped (e.g., "❌ Not found" → "Not found")
+            if "✅" in grid_status:
+                continue
+            if _STATUS_PREFIX_RE.sub('', grid_status).strip() in POSITIVE_GRID_STATUSES:
                 continue
-        if EXPAND_MARKER in row.get("Evidence & Source URLs", ""):
-            continue
         # Skip rows with cleared false positive markers
         notes = row.get("Notes", "").lower()
         if "false positive" in notes and "grid match cleared" in notes:
@@ -678,11 +809,23 @@ def expand_matches(
 
     needs_batch = bool(set(strategies) & {"batch-name", "batch-url", "twitter"})
     if needs_batch:
-        print("\n  Downloading Grid data...")
-        profiles = fetch_all_profiles(client)
-        print(f"    {len(profiles)} profiles fetched")
-        products = fetch_all_products(client)
-        print(f"    {len(products)} products fetched")
+        cache_path = Path(csv_path).parent / GRID_CACHE_FILENAME
+        cached = load_grid_cache(cache_path) if grid_cache else None
+        if cached:
+            profiles, products = cached
+            print(f"\n  Loaded Grid data from cache: {cache_path}")
+            print(f"    {len(profiles)} profiles, {len(products)} products")
+        else:
+            print("\n  Downloading Grid data...")
+            # The two downloads are independent; overlap their round trips
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                products_future = pool.submit(fetch_all_products, client)
+                profiles = fetch_all_profiles(client)
+                print(f"    {len(profiles)} profiles fetched")
+                products = products_future.result()
+                print(f"    {len(products)} products fetched")
+            if grid_cache:
+                save_grid_cache(cache_path, profiles, products)
 
         if "batch-name" in strategies:
             name_index = build_name_index(profiles, products)
@@ -691,6 +834,10 @@ def expand_matches(
             url_index = build_url_index(profiles, products)
             print(f"    URL index: {len(url_index)} domains")
 
+    thresholds = load_thresholds(Path(csv_path).parent / THRESHOLDS_FILENAME)
+    if thresholds != DEFAULT_THRESHOLDS:
+        print(f"    Thresholds: {thresholds}")
+
     # Phase 2: Run strategies in order
     all_results: List[Tuple[int, Dict, str, float]] = []
     already_matched: Set[int] = set()
@@ -700,13 +847,13 @@ def expand_matches(
         print(f"\n  Strategy: {strat}")
 
         if strat == "batch-name":
-            results = strategy_batch_name(unmatched, name_index)
+            results = strategy_batch_name(unmatched, name_index, thresholds["batch-name"])
         elif strat == "batch-url":
             # Filter out rows already matched by batch-name
             remaining = [(i, r) for i, r in unmatched if i not in already_matched]
             results = strategy_batch_url(remaining, url_index)
         elif strat == "slug":
-            results = strategy_slug(unmatched, client, already_matched)
+            results = strategy_slug(unmatched, client, already_matched, thresholds["slug"])
         elif strat == "twitter":
             results = strategy_twitter(unmatched, profiles, client, already_matched)
         else:
@@ -725,9 +872,11 @@ def expand_matches(
         print(f"    → {len(new_results)} new matches")
 
     # Phase 3: Apply matches
+    rows_by_idx = dict(unmatched)
+    changes: Dict[int, Dict] = {}
     newly_matched = 0
     for row_idx, entry, method, conf in all_results:
-        csv_name = rows[row_idx].get("Project Name", "")
+        csv_name = rows_by_idx[row_idx].get("Project Name", "")
         grid_name = entry.get("name", "")
         grid_type = entry.get("grid_type", "")
 
@@ -735,14 +884,17 @@ def expand_matches(
         print(f"  {tag}{csv_name} → {grid_name} ({grid_type}, {method}, conf={conf:.2f})")
 
         if not dry_run:
-            updates = apply_match(rows[row_idx], entry, method, conf)
-            rows[row_idx].update(updates)
+            row = rows_by_idx[row_idx]
+            changes[row_idx] = {**row, **apply_match(row, entry, method, conf)}
 
         newly_matched += 1
 
     # Write output
     if not dry_run and newly_matched > 0:
-        write_csv(rows, csv_path)
+        write_csv(
+            (changes.get(i, r) for i, r in enumerate(iter_csv(csv_path))),
+            csv_path,
+        )
         print(f"\nEnriched CSV written to: {csv_path}")
 
     return total, len(unmatched), newly_matched, strategy_counts
@@ -763,6 +915,9 @@ def main():
                         help="Preview matches without writing")
     parser.add_argument("--limit", type=int, default=0,
                         help="Process only first N unmatched rows (for testing)")
+    parser.add_argument("--grid-cache", action="store_true",
+                        help=f"Reuse the Grid profile/product download for "
+                             f"{GRID_CACHE_TTL // 3600}h ({GRID_CACHE_FILENAME} next to the CSV)")
     args = parser.parse_args()
 
     # Resolve CSV
@@ -786,7 +941,7 @@ def main():
 
     total, unmatched, matched, counts = expand_matches(
         csv_path, args.chain, strategies,
-        dry_run=args.dry_run, limit=args.limit,
+        dry_run=args.dry_run, limit=args.limit, grid_cache=args.grid_cache,
     )
 
     print(f"\n{'='*60}")
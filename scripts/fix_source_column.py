@@ -14,17 +14,26 @@ data source website, not the scraping method.
 Usage:
     python scripts/fix_source_column.py --chain near --dry-run
     python scripts/fix_source_column.py --chain near
+    python scripts/fix_source_column.py --all-chains --dry-run
 """
 
 import argparse
+import contextlib
+import io
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List, Tuple
 from urllib.parse import urlparse
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from lib.csv_utils import load_csv, write_csv, find_main_csv
+from lib.csv_utils import (
+    CSVColumnError, iter_csv, write_csv, find_main_csv, resolve_data_path,
+)
 
 
 # Known mapping: chain → what page "Generic Scraper" was used on.
@@ -33,24 +42,58 @@ GENERIC_SOURCE_BY_CHAIN = {
     "near": "wallet.near.org",
 }
 
+_WWW_RE = re.compile(r"^www\.")
 
+# Plain ASCII host[:port] up to the path/query/fragment: exactly what
+# urlparse would return as netloc, so it can skip urlparse
+_PLAIN_NETLOC_RE = re.compile(r"([A-Za-z0-9.-]*(?::[0-9]*)?)(?:[/?#]|$)")
+
+
+@lru_cache(maxsize=4096)
 def hostname_from_url(url: str) -> str:
-    """Extract hostname from a URL, stripping www. prefix."""
+    """Extract hostname from a URL, stripping www. prefix (cached per URL)."""
     url = url.strip()
     if not url:
         return ""
-    if not url.startswith(("http://", "https://")):
+    if url.startswith("https://"):
+        rest = url[8:]
+    elif url.startswith("http://"):
+        rest = url[7:]
+    else:
+        rest = url
         url = "https://" + url
+    m = _PLAIN_NETLOC_RE.match(rest)
     try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        domain = re.sub(r"^www\.", "", domain)
+        netloc = m.group(1) if m else urlparse(url).netloc
+        domain = netloc.lower()
+        domain = _WWW_RE.sub("", domain)
         domain = domain.split(":")[0]
         return domain
     except Exception:
         return ""
 
 
+@lru_cache(maxsize=None)
+def replace_generic_source(source: str, replacement: str) -> str:
+    """
+    Replace "Generic Scraper" in a Source string and deduplicate its entries.
+
+    Cached per (source, replacement): the same few Source strings repeat
+    across most of a CSV.
+    """
+    # It may appear alone or combined: "Generic Scraper; NEARCatalog"
+    new_source = source.replace("Generic Scraper", replacement)
+
+    # Deduplicate source entries case-insensitively, keeping the first
+    # spelling (in case replacement matches another source)
+    deduped: Dict[str, str] = {}
+    for p in new_source.split(";"):
+        p = p.strip()
+        if p:
+            deduped.setdefault(p.lower(), p)
+    return "; ".join(deduped.values())
+
+
 def fix_sources(
     csv_path: Path,
     chain: str,
@@ -59,20 +102,25 @@ def fix_sources(
     """
     Fix 'Generic Scraper' in the Source column.
 
+    The CSV is streamed: a first pass records only the new Source values
+    (and the log lines, printed after the row count as before), and a second
+    pass rewrites the file with those values patched in.
+
     Returns (total_rows, fixed_count, already_ok_count).
     """
     print(f"Loading CSV: {csv_path}")
-    rows = load_csv(csv_path)
-    total = len(rows)
-    print(f"  {total} rows loaded")
 
     # Determine what to replace "Generic Scraper" with
     default_source = GENERIC_SOURCE_BY_CHAIN.get(chain, "")
 
+    new_sources: Dict[int, str] = {}
+    log: List[str] = []
+    total = 0
     fixed = 0
     ok = 0
 
-    for i, row in enumerate(rows):
+    for i, row in enumerate(iter_csv(csv_path)):
+        total += 1
         source = row.get("Source", "").strip()
         if "Generic Scraper" not in source:
             ok += 1
@@ -88,35 +136,33 @@ def fix_sources(
         if not replacement:
             # Can't determine source — leave as-is but log it
             name = row.get("Project Name", "Unknown")
-            print(f"  [SKIP] Row {i+1} ({name}): no replacement available")
+            log.append(f"  [SKIP] Row {i+1} ({name}): no replacement available")
             ok += 1
             continue
 
         # Replace "Generic Scraper" in the Source string
-        # It may appear alone or combined: "Generic Scraper; NEARCatalog"
-        new_source = source.replace("Generic Scraper", replacement)
-
-        # Deduplicate source entries (in case replacement matches another source)
-        parts = [p.strip() for p in new_source.split(";")]
-        seen = set()
-        deduped = []
-        for p in parts:
-            p_lower = p.lower()
-            if p_lower not in seen and p:
-                seen.add(p_lower)
-                deduped.append(p)
-        new_source = "; ".join(deduped)
+        new_source = replace_generic_source(source, replacement)
 
         if new_source != source:
             fixed += 1
             if dry_run:
                 name = row.get("Project Name", "Unknown")
-                print(f"  [{i+1}] {name}: \"{source}\" → \"{new_source}\"")
+                log.append(f"  [{i+1}] {name}: \"{source}\" → \"{new_source}\"")
             else:
-                row["Source"] = new_source
+                new_sources[i] = new_source
+
+    print(f"  {total} rows loaded")
+    for line in log:
+        print(line)
 
     if not dry_run and fixed > 0:
-        write_csv(rows, csv_path)
+        write_csv(
+            (
+                {**row, "Source": new_sources[i]} if i in new_sources else row
+                for i, row in enumerate(iter_csv(csv_path))
+            ),
+            csv_path,
+        )
         print(f"\nFixed CSV written to: {csv_path}")
     elif dry_run:
         print(f"\n[DRY RUN] No files written.")
@@ -124,16 +170,85 @@ def fix_sources(
     return total, fixed, ok
 
 
+def _fix_chain_captured(csv_path: Path, chain: str, dry_run: bool) -> Tuple[tuple, str]:
+    """Worker for --all-chains: fix_sources() result plus its captured console output."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        result = fix_sources(csv_path, chain, dry_run=dry_run)
+    return result, out.getvalue()
+
+
+def fix_all_chains(dry_run: bool = False) -> tuple:
+    """
+    Run fix_sources() on every chain's main CSV in data/, one process per
+    CSV. Each chain's output is printed as a block in chain order; CSVs
+    missing required columns are reported and skipped.
+
+    Returns summed (total_rows, fixed_count, already_ok_count).
+    """
+    data_dir = resolve_data_path("")
+    chains = [
+        (csv_path, d.name)
+        for d in sorted(data_dir.iterdir()) if d.is_dir()
+        for csv_path in [find_main_csv(d.name)] if csv_path
+    ]
+    if not chains:
+        return 0, 0, 0
+
+    totals = [0, 0, 0]
+    workers = min(len(chains), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_fix_chain_captured, csv_path, chain, dry_run)
+            for csv_path, chain in chains
+        ]
+        for (csv_path, chain), future in zip(chains, futures):
+            print(f"\n── {chain} ──")
+            try:
+                result, output = future.result()
+            except CSVColumnError as e:
+                print(f"  [SKIP] {e}")
+                continue
+            print(output, end="")
+            for k in range(3):
+                totals[k] += result[k]
+    return tuple(totals)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Fix 'Generic Scraper' in the Source column of ecosystem CSVs"
     )
-    parser.add_argument("--chain", required=True, help="Chain ID (e.g., near)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--chain", help="Chain ID (e.g., near)")
+    target.add_argument("--all-chains", action="store_true",
+                        help="Fix every data/<chain>/ main CSV, in parallel processes")
     parser.add_argument("--csv", help="Path to CSV (auto-detected if omitted)")
     parser.add_argument("--dry-run", action="store_true",
                         help="Preview changes without writing")
     args = parser.parse_args()
 
+    if args.all_chains:
+        if args.csv:
+            print("Error: --csv cannot be combined with --all-chains")
+            sys.exit(1)
+        total, fixed, ok = fix_all_chains(dry_run=args.dry_run)
+    else:
+        total, fixed, ok = _fix_single(args)
+
+    print(f"\n{'='*60}")
+    print(f"SOURCE FIX SUMMARY")
+    print(f"{'='*60}")
+    print(f"Total rows:  {total}")
+    print(f"Fixed:       {fixed}")
+    print(f"Already OK:  {ok}")
+
+    if args.dry_run:
+        print(f"\n[DRY RUN] Re-run without --dry-run to write results.")
+
+
+def _fix_single(args) -> tuple:
+    """fix_sources() for the --chain / --csv target (exits on a missing CSV)."""
     if args.csv:
         csv_path = Path(args.csv)
     else:
@@ -146,17 +261,7 @@ def main():
         print(f"Error: CSV not found: {csv_path}")
         sys.exit(1)
 
-    total, fixed, ok = fix_sources(csv_path, args.chain, dry_run=args.dry_run)
-
-    print(f"\n{'='*60}")
-    print(f"SOURCE FIX SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total rows:  {total}")
-    print(f"Fixed:       {fixed}")
-    print(f"Already OK:  {ok}")
-
-    if args.dry_run:
-        print(f"\n[DRY RUN] Re-run without --dry-run to write results.")
+    return fix_sources(csv_path, args.chain, dry_run=args.dry_run)
 
 
 if __name__ == "__main__":
@@ -19,7 +19,9 @@ import argparse
 import json
 import re
 import sys
-import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -32,13 +34,13 @@ from lib.grid_client import GridAPIClient
 from lib.grid_client.support import (
     TARGET_ASSET_GRID_MAP,
     extract_supported_tickers,
-    check_target_support,
 )
 
 
 # ── Configuration ──────────────────────────────────────────────────────────
 
 REQUEST_DELAY = 0.3  # seconds between Grid API calls
+MAX_WORKERS = 8  # concurrent Grid API calls (starts still REQUEST_DELAY apart)
 
 
 # ── Matching Logic ─────────────────────────────────────────────────────────
@@ -55,6 +57,12 @@ def normalize_for_search(name: str) -> str:
     return clean
 
 
+@lru_cache(maxsize=4096)
+def _whole_word_re(text: str) -> re.Pattern:
+    """Compiled pattern matching text as a whole word, cached per text."""
+    return re.compile(r"\b" + re.escape(text) + r"\b")
+
+
 def score_name_match(grid_name: str, search_name: str) -> float:
     """Score how well a Grid profile name matches our project name."""
     g = grid_name.lower().strip()
@@ -62,24 +70,56 @@ def score_name_match(grid_name: str, search_name: str) -> float:
 
     if g == s:
         return 1.0
+    # Every scored case below needs one name inside the other; reject the
+    # rest with two C-level substring tests before any regex work
+    if s not in g and g not in s:
+        return 0.0
     # One contains the other as a whole word
-    if re.search(r"\b" + re.escape(s) + r"\b", g):
+    if _whole_word_re(s).search(g):
         return 0.9
-    if re.search(r"\b" + re.escape(g) + r"\b", s):
+    if _whole_word_re(g).search(s):
         return 0.85
     # One starts with the other
     if g.startswith(s) or s.startswith(g):
         return 0.8
     # Substring
-    if s in g or g in s:
-        return 0.6
-    return 0.0
+    return 0.6
+
+
+class URLSearchCache:
+    """
+    Per-run memo of Grid URL searches, shared by the lookup threads.
+
+    Websites that GridAPIClient.normalize_search_url() reduces to the same
+    query are searched once; a thread asking for one already in flight
+    waits for that result.
+    """
+
+    def __init__(self):
+        self._results: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def search(self, client: GridAPIClient, website: str) -> List[dict]:
+        key = client.normalize_search_url(website)
+        with self._lock:
+            result = self._results.get(key)
+            owner = result is None
+            if owner:
+                result = self._results[key] = Future()
+        if owner:
+            try:
+                client.wait_for_request_slot(REQUEST_DELAY)
+                result.set_result(client.search_with_support_by_url(website))
+            except Exception as e:
+                result.set_exception(e)
+        return result.result()
 
 
 def match_project(
     client: GridAPIClient,
     name: str,
     website: str,
+    url_cache: Optional[URLSearchCache] = None,
 ) -> Tuple[Optional[dict], str]:
     """
     Try to match a project to The Grid.
@@ -91,7 +131,10 @@ def match_project(
     search_term = normalize_for_search(name)
     if len(search_term) < 3:
         search_term = name.strip()  # Use original if normalization made it too short
-    profiles = client.search_with_support_by_name(search_term, limit=5) if len(search_term) >= 3 else []
+    profiles = []
+    if len(search_term) >= 3:
+        client.wait_for_request_slot(REQUEST_DELAY)
+        profiles = client.search_with_support_by_name(search_term, limit=5)
 
     best_match = None
     best_score = 0.0
@@ -112,8 +155,11 @@ def match_project(
 
     # Strategy 2: Search by URL
     if website:
-        time.sleep(REQUEST_DELAY)
-        roots = client.search_with_support_by_url(website)
+        if url_cache is not None:
+            roots = url_cache.search(client, website)
+        else:
+            client.wait_for_request_slot(REQUEST_DELAY)
+            roots = client.search_with_support_by_url(website)
         if roots:
             root = roots[0]
             profiles = root.get("profileInfos", [])
@@ -128,8 +174,9 @@ def match_project(
 
 # ── Main ───────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
 def load_chain_config(chain_id: str) -> dict:
-    """Load chain config from chains.json."""
+    """Load chain config from chains.json (cached per chain; treat as read-only)."""
     config_path = Path(__file__).parent.parent / "config" / "chains.json"
     if not config_path.exists():
         return {}
@@ -147,10 +194,15 @@ def run_grid_match(
     target_assets: List[str],
     dry_run: bool = False,
     limit: int = 0,
+    workers: int = MAX_WORKERS,
 ) -> Tuple[int, int, int, List[dict]]:
     """
     Match CSV rows to Grid and check asset support gaps.
 
+    Each distinct (name, website) pair is looked up once, on a thread pool
+    of ``workers`` threads, and each distinct URL search once per run.
+    Results are consumed in CSV order to keep output deterministic.
+
     Returns (total, matched, gaps_found, gap_report_rows).
     """
     client = GridAPIClient()
@@ -168,134 +220,165 @@ def run_grid_match(
     matched_count = 0
     gap_count = 0
     gap_report = []
-    output_rows = []
-
-    for i, row in enumerate(rows):
-        name = row.get("Project Name", "").strip()
-        website = row.get("Website", "").strip()
-
-        if not name:
-            output_rows.append(row)
-            continue
-
-        print(f"  [{i+1}/{len(rows)}] {name}", end="", flush=True)
-
-        # Rate limit
-        if i > 0:
-            time.sleep(REQUEST_DELAY)
-
-        # Match against Grid
-        match_data, match_method = match_project(client, name, website)
-
-        if not match_data:
-            print(" → not in Grid")
-            gap_report.append({
-                "Project Name": name,
-                "Status": "NOT IN GRID",
-                "Match Method": "",
-                "Grid Profile": "",
-                "Grid URL": "",
-                "Grid Supported": "",
-                "Missing Assets": "",
-                "DefiLlama Evidence": row.get("Evidence & Source URLs", ""),
-                "Notes": "Project not found in The Grid",
-            })
-            output_rows.append(row)
-            continue
-
-        matched_count += 1
-        profile = match_data["profile"]
-        root = match_data["root"]
-
-        profile_name = profile.get("name", "")
-        root_id = root.get("id", "")
-        root_url = root.get("urlMain", "")
-        root_slug = root.get("slug", "")
-        profile_status = profile.get("profileStatus", {}).get("name", "") if profile.get("profileStatus") else ""
-
-        # Get supported tickers
-        supported_tickers = extract_supported_tickers(root)
-        target_support = check_target_support(supported_tickers, target_assets)
-
-        supported_list = [a for a, v in target_support.items() if v]
-        missing_list = [a for a, v in target_support.items() if not v]
-
-        # Check for gaps: we have DefiLlama evidence but Grid is missing support
-        evidence = row.get("Evidence & Source URLs", "").strip()
-        real_gaps = []
-        for asset in missing_list:
-            # Check if DefiLlama found this asset
-            if asset in evidence:
-                real_gaps.append(asset)
-
-        has_gap = len(real_gaps) > 0
-
-        # Console output
-        status_parts = [f"matched via {match_method}"]
-        if supported_list:
-            status_parts.append(f"Grid has: {','.join(supported_list)}")
-        if real_gaps:
-            status_parts.append(f"MISSING: {','.join(real_gaps)}")
-            gap_count += 1
-        print(f" → {profile_name} ({'; '.join(status_parts)})")
-
-        # Update row
-        updates = {
-            "Profile Name": profile_name,
-            "Root ID": root_id,
-            "Matched URL": root_url,
-            "Matched via": match_method,
-            "The Grid Status": profile_status,
-        }
-
-        # Build gap note
-        if real_gaps:
-            gap_note = f"Grid missing: {', '.join(real_gaps)}"
-            existing_notes = row.get("Notes", "").strip()
-            if existing_notes:
-                if gap_note not in existing_notes:
-                    updates["Notes"] = f"{existing_notes} | {gap_note}"
-            else:
-                updates["Notes"] = gap_note
 
+    # Grid alias → target assets it counts for, built once per run so each
+    # matched row needs a single pass over its supported tickers
+    target_assets = list(dict.fromkeys(target_assets))
+    alias_to_targets: Dict[str, List[str]] = {}
+    for asset in target_assets:
+        for alias in TARGET_ASSET_GRID_MAP.get(asset, {asset}):
+            alias_to_targets.setdefault(alias, []).append(asset)
+
+    # Distinct lookups in order of first appearance; rows are walked in the
+    # same order, so each new key is exactly the next result from the pool
+    lookup_keys = list(dict.fromkeys(
+        (row.get("Project Name", "").strip(), row.get("Website", "").strip())
+        for row in rows
+        if row.get("Project Name", "").strip()
+    ))
+    matches: Dict[Tuple[str, str], Tuple[Optional[dict], str]] = {}
+
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        url_cache = URLSearchCache()
+        lookups = executor.map(
+            lambda key: match_project(client, *key, url_cache=url_cache), lookup_keys
+        )
+
+        def enriched_rows():
+            """Yield each row, Grid-enriched, as soon as its lookup is in."""
+            nonlocal matched_count, gap_count
+            for i, row in enumerate(rows):
+                name = row.get("Project Name", "").strip()
+                website = row.get("Website", "").strip()
+
+                if not name:
+                    yield row
+                    continue
+
+                print(f"  [{i+1}/{len(rows)}] {name}", end="", flush=True)
+
+                # Match against Grid
+                key = (name, website)
+                if key not in matches:
+                    matches[key] = next(lookups)
+                match_data, match_method = matches[key]
+
+                if not match_data:
+                    print(" → not in Grid")
+                    gap_report.append({
+                        "Project Name": name,
+                        "Status": "NOT IN GRID",
+                        "Match Method": "",
+                        "Grid Profile": "",
+                        "Grid URL": "",
+                        "Grid Supported": "",
+                        "Missing Assets": "",
+                        "DefiLlama Evidence": row.get("Evidence & Source URLs", ""),
+                        "Notes": "Project not found in The Grid",
+                    })
+                    yield row
+                    continue
+
+                matched_count += 1
+                profile = match_data["profile"]
+                root = match_data["root"]
+
+                profile_name = profile.get("name", "")
+                root_id = root.get("id", "")
+                root_url = root.get("urlMain", "")
+                root_slug = root.get("slug", "")
+                profile_status = profile.get("profileStatus", {}).get("name", "") if profile.get("profileStatus") else ""
+
+                # Get supported tickers
+                supported_tickers = extract_supported_tickers(root)
+                found: Set[str] = set()
+                for ticker in supported_tickers:
+                    found.update(alias_to_targets.get(ticker, ()))
+
+                supported_list = [a for a in target_assets if a in found]
+                missing_list = [a for a in target_assets if a not in found]
+
+                # Check for gaps: we have DefiLlama evidence but Grid is missing support
+                evidence = row.get("Evidence & Source URLs", "").strip()
+                # (missing assets DefiLlama found; most rows have no evidence at all)
+                real_gaps = [a for a in missing_list if a in evidence] if evidence else []
+
+                has_gap = len(real_gaps) > 0
+
+                # Console output
+                status_parts = [f"matched via {match_method}"]
+                if supported_list:
+                    status_parts.append(f"Grid has: {','.join(supported_list)}")
+                if real_gaps:
+                    status_parts.append(f"MISSING: {','.join(real_gaps)}")
+                    gap_count += 1
+                print(f" → {profile_name} ({'; '.join(status_parts)})")
+
+                # Update row
+                updates = {
+                    "Profile Name": profile_name,
+                    "Root ID": root_id,
+                    "Matched URL": root_url,
+                    "Matched via": match_method,
+                    "The Grid Status": profile_status,
+                }
+
+                # Build gap note
+                if real_gaps:
+                    gap_note = f"Grid missing: {', '.join(real_gaps)}"
+                    existing_notes = row.get("Notes", "").strip()
+                    if existing_notes:
+                        if gap_note not in existing_notes:
+                            updates["Notes"] = f"{existing_notes} | {gap_note}"
+                    else:
+                        updates["Notes"] = gap_note
+
+                if not dry_run:
+                    row.update(updates)
+
+                yield row
+
+                # Add to gap report
+                if has_gap or not supported_list:
+                    gap_report.append({
+                        "Project Name": name,
+                        "Status": "GAPS FOUND" if real_gaps else "NO TARGET SUPPORT",
+                        "Match Method": match_method,
+                        "Grid Profile": profile_name,
+                        "Grid URL": root_url,
+                        "Grid Supported": ", ".join(supported_list) if supported_list else "none",
+                        "Missing Assets": ", ".join(real_gaps) if real_gaps else ", ".join(missing_list),
+                        "DefiLlama Evidence": evidence[:200] if evidence else "",
+                        "Notes": f"Grid missing {', '.join(real_gaps)} despite DefiLlama evidence" if real_gaps else "No target assets supported in Grid",
+                    })
+
+        # Rows stream straight into the output file (or are just walked
+        # for the console/gap report on a dry run)
         if not dry_run:
-            row.update(updates)
-
-        output_rows.append(row)
-
-        # Add to gap report
-        if has_gap or not supported_list:
-            gap_report.append({
-                "Project Name": name,
-                "Status": "GAPS FOUND" if real_gaps else "NO TARGET SUPPORT",
-                "Match Method": match_method,
-                "Grid Profile": profile_name,
-                "Grid URL": root_url,
-                "Grid Supported": ", ".join(supported_list) if supported_list else "none",
-                "Missing Assets": ", ".join(real_gaps) if real_gaps else ", ".join(missing_list),
-                "DefiLlama Evidence": evidence[:200] if evidence else "",
-                "Notes": f"Grid missing {', '.join(real_gaps)} despite DefiLlama evidence" if real_gaps else "No target assets supported in Grid",
-            })
-
-    # Write outputs
-    if not dry_run:
-        # Enriched CSV
-        output_path = csv_path.with_name(csv_path.stem + "_grid_matched.csv")
-        write_csv(output_rows, output_path)
-        print(f"\nGrid-matched CSV: {output_path}")
-
-        # Gap report
-        if gap_report:
-            gap_path = csv_path.with_name(csv_path.stem + "_gap_report.csv")
-            gap_columns = [
-                "Project Name", "Status", "Match Method", "Grid Profile",
-                "Grid URL", "Grid Supported", "Missing Assets",
-                "DefiLlama Evidence", "Notes",
-            ]
-            write_csv(gap_report, gap_path, columns=gap_columns)
-            print(f"Gap report:       {gap_path}")
-    elif dry_run:
+            output_path = csv_path.with_name(csv_path.stem + "_grid_matched.csv")
+            write_csv(enriched_rows(), output_path)
+            print(f"\nGrid-matched CSV: {output_path}")
+        else:
+            for _ in enriched_rows():
+                pass
+    finally:
+        # Drop queued lookups so Ctrl-C or an error exits once the running
+        # ones finish, instead of sending every remaining Grid request
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Gap report
+    if dry_run:
         print("\n[DRY RUN] No files written.")
+    elif gap_report:
+        gap_path = csv_path.with_name(csv_path.stem + "_gap_report.csv")
+        gap_columns = [
+            "Project Name", "Status", "Match Method", "Grid Profile",
+            "Grid URL", "Grid Supported", "Missing Assets",
+            "DefiLlama Evidence", "Notes",
+        ]
+        write_csv(gap_report, gap_path, columns=gap_columns)
+        print(f"Gap report:       {gap_path}")
 
     return total, matched_count, gap_count, gap_report
 
@@ -322,6 +405,10 @@ def main():
         "--dry-run", action="store_true",
         help="Preview without writing files",
     )
+    parser.add_argument(
+        "--workers", type=int, default=MAX_WORKERS,
+        help=f"Concurrent Grid API requests (default: {MAX_WORKERS})",
+    )
     args = parser.parse_args()
 
     # Resolve CSV
@@ -351,7 +438,8 @@ def main():
     print()
 
     total, matched, gaps, gap_report = run_grid_match(
-        csv_path, args.chain, target_assets, args.dry_run, args.limit
+        csv_path, args.chain, target_assets, args.dry_run, args.limit,
+        workers=args.workers,
     )
 
     # Summary
@@ -17,15 +17,16 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from lib.columns import CORRECT_COLUMNS
-from lib.csv_utils import load_csv, append_csv, resolve_data_path, find_main_csv
+from lib.csv_utils import get_names_from_csv, load_csv, append_csv, resolve_data_path, find_main_csv
 
 
 def merge_csvs(main_csv: Path, new_csv: Path):
     """Append new projects to the main CSV, skipping duplicates."""
-    # Read existing
-    existing_rows = load_csv(main_csv)
-    existing_names = {row["Project Name"].lower() for row in existing_rows}
-    print(f"Existing entries: {len(existing_rows)}")
+    # Read existing (names only)
+    names = get_names_from_csv(main_csv)
+    existing_count = len(names)
+    existing_names = {name.lower() for name in names}
+    print(f"Existing entries: {existing_count}")
 
     # Read new projects
     new_rows = load_csv(new_csv)
@@ -48,9 +49,8 @@ def merge_csvs(main_csv: Path, new_csv: Path):
         for row in added:
             print(f"  - {row.get('Name', '?')}")
 
-    # Final count
-    final_rows = load_csv(main_csv)
-    print(f"\nFinal CSV entries: {len(final_rows)}")
+    # Final count (append_csv wrote exactly the added rows)
+    print(f"\nFinal CSV entries: {existing_count + len(added)}")
 
 
 def main():
@@ -18,11 +18,11 @@ import argparse
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from lib.csv_utils import load_csv, write_csv, find_main_csv
+from lib.csv_utils import iter_csv, write_csv, find_main_csv
 
 
 # ── Constants ─────────────────────────────────────────────────
@@ -38,9 +38,51 @@ SCAN_PATTERNS = re.compile(
     r"web3\("
 )
 
+# A scan block, matched from the start of the tag's " | " segment: the
+# whole tag segment, then each following segment that contains a
+# SCAN_PATTERNS match (same segments the old split-and-walk collected).
+# A segment is everything up to the next " | ", consumed a word at a time.
+_SEGMENT = r"[^ ]*(?: (?!\| )[^ ]*)*"
+_SCAN_BLOCK_RE = re.compile(
+    _SEGMENT
+    + r"(?: \| (?=[^ ]*?(?: (?!\| )[^ ]*?)*?(?:" + SCAN_PATTERNS.pattern + r"))"
+    + _SEGMENT + r")*"
+)
+
 # Known non-stablecoin asset tickers (chain tokens, not stablecoins)
 KNOWN_CHAIN_ASSETS = {"SOL", "STRK", "ADA", "APT", "ETH", "BTC"}
 
+# Tickers with their own result flags or known-asset handling; any other
+# "<TICKER> keywords" segment is a dynamic stablecoin
+_KNOWN_ALL = frozenset(KNOWN_CHAIN_ASSETS | {"USDT", "USDC"})
+
+# Every fixed scan-block signal in one pass. The alternation sits in a
+# lookahead so matches are zero-width: overlapping occurrences are all
+# found, exactly like the equivalent substring checks.
+_SCAN_SIGNALS_RE = re.compile(
+    r"(?=(?P<asset>"
+    + "|".join(sorted(_KNOWN_ALL))
+    + r") keywords"
+    r"|(?P<mention>stablecoin mentions)"
+    r"|(?P<web3>(?i:web3)\())"
+)
+
+# Any ticker's keyword segment, for dynamic stablecoin discovery
+_OTHER_TICKER_RE = re.compile(r"([A-Z0-9]{2,10})\s+keywords")
+
+# Result for notes without a scan block; parse_scan_note returns a copy
+# with its own other_stablecoin_symbols list
+_EMPTY_SCAN = {
+    "has_scan": False,
+    "has_usdt": False,
+    "has_usdc": False,
+    "has_other_stablecoin": False,
+    "other_stablecoin_symbols": [],
+    "has_stablecoin_mention": False,
+    "has_web3_signal": False,
+    "asset_count": 0,
+}
+
 
 # ── Note Parsing ──────────────────────────────────────────────
 
@@ -51,69 +93,38 @@ def parse_scan_note(notes: str) -> Dict:
     Returns dict with scan findings: has_usdt, has_usdc,
     has_stablecoin_mention, has_web3_signal, asset_count.
     """
-    result = {
-        "has_scan": False,
-        "has_usdt": False,
-        "has_usdc": False,
-        "has_other_stablecoin": False,
-        "other_stablecoin_symbols": [],
-        "has_stablecoin_mention": False,
-        "has_web3_signal": False,
-        "asset_count": 0,
-    }
-
     if UNVERIFIED_TAG not in notes:
-        return result
-
-    result["has_scan"] = True
+        return dict(_EMPTY_SCAN, other_stablecoin_symbols=[])
 
-    # Split Notes on " | " and find the scan block
-    parts = notes.split(" | ")
-    scan_start = None
-    for i, part in enumerate(parts):
-        if UNVERIFIED_TAG in part:
-            scan_start = i
-            break
+    result = dict(_EMPTY_SCAN, has_scan=True, other_stablecoin_symbols=[])
 
-    if scan_start is None:
+    # Every scan signal needs "keywords", "stablecoin mentions" or
+    # "web3(" (any case, so test its "3(" tail) somewhere in Notes
+    if "keywords" not in notes and "stablecoin mentions" not in notes and "3(" not in notes:
         return result
 
-    # Collect scan-block segments (tag segment + subsequent matching segments)
-    scan_parts = []
-    for i in range(scan_start, len(parts)):
-        part = parts[i].strip()
-        if i == scan_start:
-            scan_parts.append(part)
-        elif SCAN_PATTERNS.search(part):
-            scan_parts.append(part)
-        else:
-            break
-
-    full_text = " | ".join(scan_parts)
+    # Slice the scan block (tag segment + subsequent matching segments)
+    # straight out of Notes
+    segment_start = notes.rfind(" | ", 0, notes.index(UNVERIFIED_TAG))
+    segment_start = 0 if segment_start < 0 else segment_start + 3
+    full_text = _SCAN_BLOCK_RE.match(notes, segment_start).group(0)
     asset_types = set()
 
-    if "USDT keywords" in full_text:
-        result["has_usdt"] = True
-        asset_types.add("USDT")
-    if "USDC keywords" in full_text:
-        result["has_usdc"] = True
-        asset_types.add("USDC")
-    if "stablecoin mentions" in full_text:
-        result["has_stablecoin_mention"] = True
-    if "web3(" in full_text.lower():
-        result["has_web3_signal"] = True
-
-    for asset in KNOWN_CHAIN_ASSETS:
-        if f"{asset} keywords" in full_text:
-            asset_types.add(asset)
+    for m in _SCAN_SIGNALS_RE.finditer(full_text):
+        if m.group("asset"):
+            asset_types.add(m.group("asset"))
+        elif m.group("mention"):
+            result["has_stablecoin_mention"] = True
+        else:
+            result["has_web3_signal"] = True
+    result["has_usdt"] = "USDT" in asset_types
+    result["has_usdc"] = "USDC" in asset_types
 
     # Detect dynamic stablecoin keywords (any ticker not in known sets)
-    _other_re = re.compile(r"([A-Z0-9]{2,10})\s+keywords")
-    _known_all = KNOWN_CHAIN_ASSETS | {"USDT", "USDC"}
     other_stablecoin_symbols = []
-    for m in _other_re.finditer(full_text):
+    for m in _OTHER_TICKER_RE.finditer(full_text):
         sym = m.group(1)
-        if sym not in _known_all:
+        if sym not in _KNOWN_ALL:
             other_stablecoin_symbols.append(sym)
             asset_types.add(sym)
 
@@ -125,8 +136,11 @@ def parse_scan_note(notes: str) -> Dict:
 
 # ── Promotion Strategies ──────────────────────────────────────
 
+_TRUE_VALUES = frozenset({"TRUE", "YES", "1"})
+
+
 def _is_true(val: str) -> bool:
-    return val.strip().upper() in ("TRUE", "YES", "1")
+    return val.strip().upper() in _TRUE_VALUES
 
 
 def apply_strategy_usdt(row: Dict, scan: Dict) -> Tuple[Dict, str]:
@@ -201,13 +215,32 @@ def apply_strategy_web3(row: Dict, scan: Dict) -> Tuple[Dict, str]:
     return {"Web3 but no stablecoin": "TRUE"}, "web3 → Web3 (no stablecoin)"
 
 
+def select_strategy(scan: Dict) -> Callable[[Dict, Dict], Tuple[Dict, str]]:
+    """
+    The one strategy that can fire for a scan's signals.
+
+    The strategies' signal conditions are mutually exclusive (USDT, else
+    any stablecoin, else web3), so trying them in order and taking the
+    first with updates is the same as calling only this one.
+    """
+    if scan["has_usdt"]:
+        return apply_strategy_usdt
+    if scan["has_usdc"] or scan["has_stablecoin_mention"] or scan["has_other_stablecoin"]:
+        return apply_strategy_general_stablecoin
+    return apply_strategy_web3
+
+
 # ── Notes & Evidence helpers ──────────────────────────────────
 
-def annotate_notes(row: Dict) -> None:
-    """Replace [UNVERIFIED website-scan] with [PROMOTED from website-scan]."""
-    notes = row.get("Notes", "")
+def annotate_notes(row: Dict, notes: str) -> str:
+    """
+    Replace [UNVERIFIED website-scan] with [PROMOTED from website-scan].
+
+    notes is the row's current Notes value; returns the new one.
+    """
     if UNVERIFIED_TAG in notes:
-        row["Notes"] = notes.replace(UNVERIFIED_TAG, PROMOTED_TAG)
+        notes = row["Notes"] = notes.replace(UNVERIFIED_TAG, PROMOTED_TAG)
+    return notes
 
 
 def add_promote_marker(row: Dict) -> None:
@@ -230,26 +263,22 @@ def promote_hints(
     """
     Promote high-confidence website-scan hints to boolean columns.
 
+    The CSV is streamed: a first pass keeps only the rows it changes (and
+    the log lines, printed after the row count as before), and a second
+    pass rewrites the file with those rows swapped in.
+
     Returns (total_rows, candidates, promoted_usdt, promoted_stablecoin, promoted_web3).
     """
-    rows = load_csv(csv_path)
-    total = len(rows)
-
-    strategies = [
-        apply_strategy_usdt,
-        apply_strategy_general_stablecoin,
-        apply_strategy_web3,
-    ]
-
+    changes: Dict[int, Dict] = {}
+    log: List[str] = []
+    total = 0
     candidates = 0
     promoted_usdt = 0
     promoted_stablecoin = 0
     promoted_web3 = 0
-    any_changes = False
 
-    print(f"Scanning {total} rows for promotable website-scan hints...\n")
-
-    for row in rows:
+    for i, row in enumerate(iter_csv(csv_path)):
+        total += 1
         notes = row.get("Notes", "")
         evidence = row.get("Evidence & Source URLs", "")
 
@@ -268,13 +297,8 @@ def promote_hints(
         if not scan["has_scan"]:
             continue
 
-        # Try strategies in order (first match wins)
-        updates = {}
-        label = ""
-        for strategy in strategies:
-            updates, label = strategy(row, scan)
-            if updates:
-                break
+        # Only the strategy matching the scan's signals can fire
+        updates, label = select_strategy(scan)(row, scan)
 
         confidence = "high" if scan["asset_count"] >= 2 else "standard"
 
@@ -288,11 +312,11 @@ def promote_hints(
                 promoted_web3 += 1
 
             prefix = "[DRY] " if dry_run else ""
-            print(f"  {prefix}{name} → {label} ({confidence} confidence, {scan['asset_count']} assets)")
+            log.append(f"  {prefix}{name} → {label} ({confidence} confidence, {scan['asset_count']} assets)")
 
             if not dry_run:
                 row.update(updates)
-                annotate_notes(row)
+                notes = annotate_notes(row, notes)
                 add_promote_marker(row)
                 # Add explicit stablecoin note when promoting without USDT
                 if "General Stablecoin Adoption" in updates and not scan["has_usdt"]:
@@ -304,19 +328,25 @@ def promote_hints(
                     if found_coins:
                         coin_str = ", ".join(found_coins)
                         stbl_note = f"{coin_str} support found, no evidence of USDT support"
-                        current_notes = row.get("Notes", "")
-                        if stbl_note not in current_notes:
-                            row["Notes"] = f"{current_notes} | {stbl_note}" if current_notes else stbl_note
-                any_changes = True
+                        if stbl_note not in notes:
+                            row["Notes"] = f"{notes} | {stbl_note}" if notes else stbl_note
+                changes[i] = row
         else:
             # No strategy fired (columns already set), but still mark as processed
             if not dry_run:
-                annotate_notes(row)
+                annotate_notes(row, notes)
                 add_promote_marker(row)
-                any_changes = True
+                changes[i] = row
 
-    if any_changes and not dry_run:
-        write_csv(rows, csv_path)
+    print(f"Scanning {total} rows for promotable website-scan hints...\n")
+    for line in log:
+        print(line)
+
+    if changes and not dry_run:
+        write_csv(
+            (changes.get(i, row) for i, row in enumerate(iter_csv(csv_path))),
+            csv_path,
+        )
         print(f"\nEnriched CSV written to: {csv_path}")
 
     return total, candidates, promoted_usdt, promoted_stablecoin, promoted_web3
@@ -9,7 +9,9 @@ Usage:
 
 import argparse
 import csv
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent dir to path for lib imports
@@ -19,6 +21,9 @@ from lib.columns import CORRECT_COLUMNS
 from lib.csv_utils import find_main_csv, resolve_data_path
 
 
+# Read/write buffer for the CSV files: fewer, larger syscalls than the 8 KiB default
+IO_BUFFER_SIZE = 1 << 20
+
 # Mapping from old column names to new standard column names
 COLUMN_MAPPING = {
     "Name": "Project Name",
@@ -55,57 +60,78 @@ def transform_csv(csv_path: Path, output_path: Path = None):
     if output_path is None:
         output_path = csv_path.with_name(csv_path.stem + "_transformed.csv")
 
-    # Read existing CSV
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        old_fieldnames = reader.fieldnames
-        rows = list(reader)
-
-    print(f"Read {len(rows)} rows from existing CSV")
-    print(f"Old columns ({len(old_fieldnames)}): {old_fieldnames}")
-    print(f"New columns ({len(CORRECT_COLUMNS)}): {list(CORRECT_COLUMNS)}")
-
-    # Build reverse mapping: new_col -> [old_col, ...]
-    reverse_map = {}
-    for old_col, new_col in COLUMN_MAPPING.items():
-        if new_col is not None:
-            reverse_map.setdefault(new_col, []).append(old_col)
-
-    # Transform each row
-    transformed_rows = []
-    for row in rows:
-        new_row = {}
-        for col in CORRECT_COLUMNS:
-            # Check if we have a direct match in the source row
-            if col in row:
-                new_row[col] = row[col]
-            # Check if an old column maps to this new column
-            elif col in reverse_map:
-                value = ''
-                for old_col in reverse_map[col]:
-                    if old_col in row and row[old_col]:
-                        value = row[old_col]
-                        break
-                new_row[col] = value
-            else:
-                new_row[col] = ''
-
-        # Build X Link from X Handle if not already set
-        if not new_row.get("X Link") and new_row.get("X Handle"):
-            handle = new_row["X Handle"].lstrip("@").strip()
-            if handle and not handle.startswith("http"):
-                new_row["X Link"] = f"https://x.com/{handle}"
+    with open(csv_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        old_fieldnames = next(reader, [])
 
-        transformed_rows.append(new_row)
+        print(f"Old columns ({len(old_fieldnames)}): {old_fieldnames}")
+        print(f"New columns ({len(CORRECT_COLUMNS)}): {list(CORRECT_COLUMNS)}")
 
-    # Write transformed CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=CORRECT_COLUMNS)
-        writer.writeheader()
-        writer.writerows(transformed_rows)
+        # Build reverse mapping: new_col -> [old_col, ...]
+        reverse_map = {}
+        for old_col, new_col in COLUMN_MAPPING.items():
+            if new_col is not None:
+                reverse_map.setdefault(new_col, []).append(old_col)
 
+        # Resolve each new column against the header once: (direct source
+        # index or None, fallback indices tried in order for a non-empty value).
+        # A repeated header name resolves to its last position, as in DictReader.
+        old_index = {col: i for i, col in enumerate(old_fieldnames)}
+        plan = []
+        for col in CORRECT_COLUMNS:
+            if col in old_index:
+                plan.append((old_index[col], ()))
+            else:
+                fallbacks = tuple(
+                    old_index[old_col] for old_col in reverse_map.get(col, ())
+                    if old_col in old_index
+                )
+                plan.append((None, fallbacks))
+        x_link = CORRECT_COLUMNS.index("X Link")
+        x_handle = CORRECT_COLUMNS.index("X Handle")
+        width = len(old_fieldnames)
+
+        # Transform and write row by row. The output goes to a temp file
+        # that replaces output_path at the end, so it may be the input.
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".tmp", prefix=f".{output_path.name}.", dir=output_path.parent,
+        )
+        total = 0
+        try:
+            with os.fdopen(fd, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as out:
+                writer = csv.writer(out)
+                writer.writerow(CORRECT_COLUMNS)
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row += [''] * (width - len(row))
+                    new_row = []
+                    for src, fallbacks in plan:
+                        if src is not None:
+                            new_row.append(row[src])
+                        else:
+                            new_row.append(next((row[i] for i in fallbacks if row[i]), ''))
+
+                    # Build X Link from X Handle if not already set
+                    if not new_row[x_link] and new_row[x_handle]:
+                        handle = new_row[x_handle].lstrip("@").strip()
+                        if handle and not handle.startswith("http"):
+                            new_row[x_link] = f"https://x.com/{handle}"
+
+                    writer.writerow(new_row)
+                    total += 1
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    print(f"Read {total} rows from existing CSV")
     print(f"\nTransformed CSV written to: {output_path}")
-    print(f"Total rows: {len(transformed_rows)}")
+    print(f"Total rows: {total}")
 
     # Show column differences
     old_set = set(old_fieldnames)